@@ -1,8 +1,10 @@
+import json
+import string
 import sys
-import subprocess
+import time
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-import traceback
 
 from PySide6.QtCore import Qt, QSettings, QTimer, QEasingCurve, QPropertyAnimation
 from PySide6.QtGui import QFont, QDesktopServices, QKeySequence, QAction
@@ -23,12 +25,16 @@ from PySide6.QtWidgets import (
 )
 
 
+_IS_WIN = sys.platform == "win32"
+
 WORKSPACE_TITLE = "HRT Journey Tracker — Launcher"
 ORG_NAME = "HRTJourneyTracker"
 APP_NAME = "Launcher"
 
 APP_SCAN_MAX_DEPTH = 2
-APP_SCAN_EXCLUDE_DIRS = {"launcher", ".git", "__pycache__", "build", "dist", "storage", "assets", ".venv", "venv"}
+APP_SCAN_EXCLUDE_DIRS = frozenset(
+    {"launcher", ".git", "__pycache__", "build", "dist", "storage", "assets", ".venv", "venv"}
+)
 APP_SCAN_EXCLUDE_FILES = {
     "__init__.py",
     "setup.py",
@@ -37,7 +43,8 @@ APP_SCAN_EXCLUDE_FILES = {
 
 APP_ENTRY_PRIORITY = ("main.py", "app.py", "run.py",)  # fallback names when <FolderName>.py not present
 
-SETTINGS_RECENTS_GROUP = "recents"  # QSettings group
+SETTINGS_RECENTS_GROUP = "recents"  # legacy QSettings group (pre-JSON format, migrated on load)
+SETTINGS_RECENTS_KEY = "recentsMap"  # whole map stored as one JSON string
 SETTINGS_MAX_RECENTS = 8
 
 
@@ -164,10 +171,12 @@ QLabel#Hint { color: #5D6873; font-size: 11px; }
 SETTINGS_THEME_KEY = "ui/theme"  # "dark" | "light"
 
 
+@lru_cache(maxsize=1)
 def _launcher_dir() -> Path:
     return Path(__file__).resolve().parent
 
 
+@lru_cache(maxsize=1)
 def _workspace_root() -> Path:
     """
     This file lives in .../HRT Journey tracker/Launcher/Launcher.py.
@@ -192,6 +201,8 @@ def _validate_script(parent, script: Path) -> tuple[bool, str]:
 
 
 def _start_script(parent, script: Path) -> bool:
+    import subprocess  # deferred: only needed once the user actually launches something
+
     ok, msg = _validate_script(parent, script)
     if not ok:
         QMessageBox.critical(parent, "Not found", msg)
@@ -201,7 +212,7 @@ def _start_script(parent, script: Path) -> bool:
         subprocess.Popen(
             [sys.executable, str(script)],
             cwd=str(script.parent),
-            close_fds=(sys.platform != "win32"),
+            close_fds=not _IS_WIN,
         )
         return True
     except Exception as e:
@@ -209,14 +220,21 @@ def _start_script(parent, script: Path) -> bool:
         return False
 
 
+_KEY_DELETE_TABLE = str.maketrans("", "", " -_")
+
+
+def _normalize_key(name: str) -> str:
+    # "My-Tool Name" / "my_tool_name" / "MyToolName" all map to "mytoolname"
+    return name.lower().translate(_KEY_DELETE_TABLE)
+
+
 def _is_probably_entry_script(p: Path) -> bool:
     if p.suffix.lower() != ".py":
         return False
     if p.name.lower() in APP_SCAN_EXCLUDE_FILES:
         return False
-    # avoid picking things in storage/build/dist/etc
-    lowered_parts = {part.lower() for part in p.parts}
-    if any(d in lowered_parts for d in APP_SCAN_EXCLUDE_DIRS):
+    # avoid picking things in storage/build/dist/etc (short-circuits, no intermediate set)
+    if any(part.lower() in APP_SCAN_EXCLUDE_DIRS for part in p.parts):
         return False
     return True
 
@@ -236,12 +254,12 @@ def _pick_entry_script_for_folder(folder: Path) -> Path | None:
     if not py_files:
         return None
 
-    folder_key = folder.name.lower().replace(" ", "").replace("-", "").replace("_", "")
-    by_key = {p.stem.lower().replace(" ", "").replace("-", "").replace("_", ""): p for p in py_files}
+    folder_key = _normalize_key(folder.name)
 
-    # 1) <FolderName>.py
-    if folder_key in by_key:
-        return by_key[folder_key]
+    # 1) <FolderName>.py — stems are normalized lazily; most folders match here
+    for p in py_files:
+        if _normalize_key(p.stem) == folder_key:
+            return p
 
     # 2) common entrypoint names
     for name in APP_ENTRY_PRIORITY:
@@ -297,14 +315,16 @@ def _discover_apps() -> list[dict]:
                 "name": child.name,
                 "script": script.resolve(),
                 "label": f"Open {child.name}",
+                # discovery just proved this is a real .py file; no need to re-stat it
+                "validated": True,
             }
         )
 
     return apps
 
 
-def _safe_now_iso() -> str:
-    return datetime.now().isoformat(timespec="seconds")
+def _now_epoch_str() -> str:
+    return str(int(time.time()))
 
 
 def _try_parse_iso(s: str) -> datetime | None:
@@ -314,12 +334,10 @@ def _try_parse_iso(s: str) -> datetime | None:
         return None
 
 
-def _format_when(dt: datetime) -> str:
-    # Human-ish, predictable formatting
+def _format_when(ts: int) -> str:
+    # Human-ish, predictable formatting; pure integer math until we need a date
     try:
-        now = datetime.now()
-        delta = now - dt
-        seconds = int(delta.total_seconds())
+        seconds = max(0, int(time.time()) - ts)
         if seconds < 60:
             return "just now" if seconds < 10 else f"{seconds} seconds ago"
         minutes = seconds // 60
@@ -329,12 +347,13 @@ def _format_when(dt: datetime) -> str:
         if hours < 24:
             return f"{hours} hour{'s' if hours != 1 else ''} ago"
         days = hours // 24
+        dt = datetime.fromtimestamp(ts)
         if days == 1:
-            return f"yesterday at {dt.strftime('%-I:%M %p') if sys.platform != 'win32' else dt.strftime('%I:%M %p').lstrip('0')}"
+            return f"yesterday at {dt.strftime('%I:%M %p').lstrip('0')}"
         # include date + time for older entries
         return dt.strftime("%Y-%m-%d %I:%M %p").replace(" 0", " ")
     except Exception:
-        return dt.isoformat(timespec="minutes")
+        return str(ts)
 
 
 def _diagnose_script(script: Path) -> tuple[bool, str]:
@@ -349,21 +368,18 @@ def _diagnose_script(script: Path) -> tuple[bool, str]:
     if not script.parent.exists():
         return False, f"Missing folder:\n{script.parent}"
 
-    # Syntax check (py_compile)
+    # Syntax check (in-process compile; same check py_compile does, minus the interpreter boot)
     try:
-        proc = subprocess.run(
-            [sys.executable, "-m", "py_compile", str(script)],
-            cwd=str(script.parent),
-            capture_output=True,
-            text=True,
-        )
-        if proc.returncode != 0:
-            detail = (proc.stderr or proc.stdout or "").strip()
-            return False, "Python could not compile this script (syntax/import-time error).\n\n" + (detail or "(no details)")
+        source = script.read_bytes()
+        compile(source, str(script), "exec")
+    except SyntaxError as e:
+        return False, f"Python could not compile this script (syntax error).\n\n{e.msg} at line {e.lineno}"
     except Exception as e:
-        return False, f"Could not run py_compile.\n\n{e}"
+        return False, f"Could not read or compile this script.\n\n{e}"
 
     # Common dependency check (these apps use PySide6)
+    import subprocess  # deferred: only needed once the user actually launches something
+
     try:
         proc = subprocess.run(
             [sys.executable, "-c", "import PySide6"],
@@ -391,6 +407,9 @@ class LauncherWindow(QMainWindow):
         self.setWindowTitle(WORKSPACE_TITLE)
 
         self._settings = QSettings(ORG_NAME, APP_NAME)
+        self._recents: dict[str, str] = self._load_recents()
+        self._normalize_recents()
+        self._rebuild_recents_index()
         self._launched: set[Path] = set()
         self._theme: str = str(self._settings.value(SETTINGS_THEME_KEY, "dark") or "dark").lower()
         if self._theme not in ("dark", "light"):
@@ -570,6 +589,13 @@ class LauncherWindow(QMainWindow):
         root_l.addLayout(main_row, 1)
         root_l.addWidget(footer)
 
+        # Debounced reflow: resizeEvent fires per pixel of drag; reflow once it settles
+        self._reflow_cols = 0
+        self._reflow_timer = QTimer(self)
+        self._reflow_timer.setSingleShot(True)
+        self._reflow_timer.setInterval(50)
+        self._reflow_timer.timeout.connect(self._reflow_apps_grid)
+
         self._restore_window_state()
         self.setMinimumWidth(860)
         self.setMinimumHeight(440)
@@ -579,7 +605,7 @@ class LauncherWindow(QMainWindow):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._reflow_apps_grid()
+        self._reflow_timer.start()
 
     def _about(self):
         QMessageBox.information(
@@ -595,91 +621,114 @@ class LauncherWindow(QMainWindow):
             "- Launch app: Alt+<letter> (auto-assigned; see button text/tooltip)\n",
         )
 
-    def _clear_grid(self):
-        for btn in self._app_buttons:
-            btn.setParent(None)
-        self._app_buttons.clear()
+    def _load_recents(self) -> dict[str, str]:
+        raw = self._settings.value(SETTINGS_RECENTS_KEY)
+        if isinstance(raw, str) and raw:
+            try:
+                m = json.loads(raw)
+                if isinstance(m, dict):
+                    return {k: v for k, v in m.items() if isinstance(k, str) and isinstance(v, str) and v}
+            except Exception:
+                pass
 
-    def _read_recent_map(self) -> dict[str, str]:
+        # Migrate the legacy one-key-per-script group, then drop it.
         self._settings.beginGroup(SETTINGS_RECENTS_GROUP)
         try:
-            keys = self._settings.allKeys()
             out: dict[str, str] = {}
-            for k in keys:
+            for k in self._settings.allKeys():
                 v = self._settings.value(k)
                 if isinstance(v, str) and v:
                     out[k] = v
-            return out
+            if out:
+                self._settings.remove("")
         finally:
             self._settings.endGroup()
+        if out:
+            self._settings.setValue(SETTINGS_RECENTS_KEY, json.dumps(out))
+        return out
+
+    def _normalize_recents(self) -> None:
+        # Older versions stored ISO timestamps; convert once to epoch seconds.
+        changed = False
+        for k, v in self._recents.items():
+            if not v.isdigit():
+                dt = _try_parse_iso(v)
+                self._recents[k] = str(int(dt.timestamp())) if dt else "0"
+                changed = True
+        if changed:
+            self._settings.setValue(SETTINGS_RECENTS_KEY, json.dumps(self._recents))
+
+    def _rebuild_recents_index(self) -> None:
+        # Path-keyed view of the recents map, so renders never coerce scripts to str
+        self._recents_by_script = {Path(k): v for k, v in self._recents.items()}
 
     def _write_recent(self, script: Path) -> None:
-        self._settings.beginGroup(SETTINGS_RECENTS_GROUP)
-        try:
-            self._settings.setValue(str(script), _safe_now_iso())
-            # best-effort cap: remove oldest extras
-            m = self._read_recent_map()
-            if len(m) > SETTINGS_MAX_RECENTS:
-                parsed = []
-                for k, v in m.items():
-                    dt = _try_parse_iso(v) or datetime.min
-                    parsed.append((dt, k))
-                parsed.sort()  # oldest first
-                for _, k in parsed[: max(0, len(m) - SETTINGS_MAX_RECENTS)]:
-                    self._settings.remove(k)
-        finally:
-            self._settings.endGroup()
+        self._recents[str(script)] = _now_epoch_str()
+        # cap: keep newest entries only (fixed-width epoch strings sort correctly as strings)
+        if len(self._recents) > SETTINGS_MAX_RECENTS:
+            newest = sorted(self._recents.items(), key=lambda kv: kv[1], reverse=True)
+            self._recents = dict(newest[:SETTINGS_MAX_RECENTS])
+        self._settings.setValue(SETTINGS_RECENTS_KEY, json.dumps(self._recents))
+        self._settings.sync()  # one deterministic flush instead of backend-timed writes
+        self._rebuild_recents_index()
 
     def _render_recent_activity(self) -> None:
         if not getattr(self, "_apps", None):
             self.recent_lbl.setText("No apps discovered yet.")
             return
 
-        m = self._read_recent_map()
+        m = self._recents_by_script
         lines: list[str] = []
         for a in self._apps:
-            script = a["script"]
-            ts = m.get(str(script), "")
+            ts = m.get(a["script"], "")
             if not ts:
                 lines.append(f"{a['name']} last opened: never")
                 continue
-            dt = _try_parse_iso(ts)
-            if not dt:
+            try:
+                lines.append(f"{a['name']} last opened: {_format_when(int(ts))}")
+            except ValueError:
                 lines.append(f"{a['name']} last opened: {ts}")
-            else:
-                lines.append(f"{a['name']} last opened: {_format_when(dt)}")
         self.recent_lbl.setText("\n".join(lines))
 
     def _rebuild_apps_ui(self):
         self._apps = _discover_apps()
-        self._clear_grid()
 
         ws = _workspace_root()
         self.subtitle.setText(f"Workspace: {ws}")
 
-        used: set[str] = set()
+        remaining = set(string.ascii_uppercase)
 
         def pick_shortcut(title: str) -> str | None:
-            for ch in title:
-                c = ch.upper()
-                if "A" <= c <= "Z" and c not in used:
-                    used.add(c)
-                    return f"Alt+{c}"
-            return None
-
-        for appinfo in self._apps:
-            btn = QPushButton(appinfo["label"])
-            btn.setToolTip(str(appinfo["script"]))
+            c = next((ch for ch in title.upper() if ch in remaining), None)
+            if c is None:
+                return None
+            remaining.discard(c)
+            return f"Alt+{c}"
+
+        # Reuse pooled buttons across refreshes; only create/destroy when the count changes
+        while len(self._app_buttons) < len(self._apps):
+            btn = QPushButton()
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             btn.setMinimumHeight(40)
+            self._app_buttons.append(btn)
+        while len(self._app_buttons) > len(self._apps):
+            btn = self._app_buttons.pop()
+            self.apps_grid.removeWidget(btn)
+            btn.deleteLater()
+
+        for appinfo, btn in zip(self._apps, self._app_buttons):
+            btn.setText(appinfo["label"])
+            btn.setToolTip(str(appinfo["script"]))
+            try:
+                btn.clicked.disconnect()
+            except (RuntimeError, TypeError):
+                pass  # no previous connection (fresh button)
             btn.clicked.connect(lambda _=False, s=appinfo["script"], b=btn: self._launch(s, b))
 
             sc = pick_shortcut(appinfo["name"])
-            if sc:
-                btn.setShortcut(QKeySequence(sc))
-
-            self._app_buttons.append(btn)
+            btn.setShortcut(QKeySequence(sc) if sc else QKeySequence())
 
+        self._reflow_cols = 0  # buttons changed; force a real reflow
         self._reflow_apps_grid()
 
         if not self._apps:
@@ -692,13 +741,6 @@ class LauncherWindow(QMainWindow):
         self._render_recent_activity()
 
     def _reflow_apps_grid(self):
-        # remove current positions
-        while self.apps_grid.count():
-            item = self.apps_grid.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.setParent(self.centralWidget())
-
         if not self._app_buttons:
             return
 
@@ -706,6 +748,16 @@ class LauncherWindow(QMainWindow):
         host_w = self.centralWidget().width()
         available = max(1, host_w - 48)
         cols = max(1, min(4, available // 260))
+        if cols == self._reflow_cols:
+            return
+        self._reflow_cols = cols
+
+        # remove current positions
+        while self.apps_grid.count():
+            item = self.apps_grid.takeAt(0)
+            w = item.widget()
+            if w is not None:
+                w.setParent(self.centralWidget())
 
         for i, btn in enumerate(self._app_buttons):
             r, c = divmod(i, cols)
@@ -718,6 +770,8 @@ class LauncherWindow(QMainWindow):
 
         missing: list[str] = []
         for a in self._apps:
+            if a.get("validated"):
+                continue
             ok, _ = _validate_script(self, a["script"])
             if not ok:
                 missing.append(f"- {a['script']}")
@@ -749,16 +803,25 @@ class LauncherWindow(QMainWindow):
         theme = (theme or "dark").lower()
         if theme not in ("dark", "light"):
             theme = "dark"
+
+        light = theme == "light"
+        qss = LIGHT_QSS if light else DARK_QSS
+        app = QApplication.instance()
+
+        # setStyleSheet repolishes every widget in the tree; skip when nothing changed
+        if theme == self._theme and app.styleSheet() == qss:
+            if persist:
+                self._settings.setValue(SETTINGS_THEME_KEY, theme)
+            return
         self._theme = theme
 
         # Keep action in sync
-        light = theme == "light"
         self.act_toggle_theme.blockSignals(True)
         self.act_toggle_theme.setChecked(light)
         self.act_toggle_theme.setText("Light theme")
         self.act_toggle_theme.blockSignals(False)
 
-        QApplication.instance().setStyleSheet(LIGHT_QSS if light else DARK_QSS)
+        app.setStyleSheet(qss)
         if persist:
             self._settings.setValue(SETTINGS_THEME_KEY, theme)
 
@@ -820,6 +883,9 @@ class LauncherWindow(QMainWindow):
             self._set_status(f"Launched:\n{script.name}")
         else:
             self._set_status("Launch failed. See error dialog.")
+            for a in self._apps:
+                if a["script"] == script:
+                    a["validated"] = False  # force a real re-check for this one
             self._refresh_button_states()
 
     def _open_workspace(self) -> None:
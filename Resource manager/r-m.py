@@ -4,7 +4,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QMenu,
     QWidget,
-    QListWidget,
+    QListView,
     QPushButton,
     QLineEdit,
     QLabel,
@@ -12,13 +12,43 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 from PySide6.QtGui import QDesktopServices
-from PySide6.QtCore import QUrl, Qt
+from PySide6.QtCore import QUrl, Qt, QTimer, QAbstractListModel, QModelIndex
 
 # --- ADDED: persistence for LinkStorage ---
+import bisect
+import functools
 import json
+import mmap
+import os
+import re
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+try:
+    import orjson  # optional: C-speed JSON encode/decode for larger stores
+except ImportError:
+    orjson = None
+
+# Stores past this size are parsed straight from the page cache via mmap
+# instead of copying the whole file into a bytes object first
+_MMAP_MIN_BYTES = 8 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_url(url: str) -> str:
+    u = (url or "").strip()
+    if not u:
+        return ""
+    if "://" not in u:
+        u = "https://" + u
+    return u
+
+
+@functools.lru_cache(maxsize=512)
+def _is_valid_http_url(u: str) -> bool:
+    qurl = QUrl(u)
+    return qurl.isValid() and qurl.scheme() in ("http", "https")
+
 
 class LinkManagerUI(QWidget):
     """Minimal UI used by LinkManagerApp when a separate generated UI is not present."""
@@ -42,8 +72,13 @@ class LinkManagerUI(QWidget):
         self.clear_inputs_btn = QPushButton("Clear Inputs")
         self.clear_all_btn = QPushButton("Clear All")
 
-        # List and status
-        self.list_widget = QListWidget()
+        # List and status (model-based view: only visible rows materialize strings)
+        self.list_widget = QListView()
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.setEditTriggers(QListView.NoEditTriggers)
+        # Lay out rows in batches so a large store doesn't block the first paint
+        self.list_widget.setLayoutMode(QListView.Batched)
+        self.list_widget.setBatchSize(64)
         self.status_label = QLabel("Ready")
 
         # Layout
@@ -85,86 +120,346 @@ class LinkStorage:
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
         self.data: List[Dict[str, str]] = []
+        # Parallel list of pre-lowercased "title\nurl" haystacks for searching
+        self._hay: List[str] = []
+        # Lazily built concatenation of _hay (plus row offsets) so one C-level
+        # str.find scans every row instead of N Python-level `in` tests
+        self._hay_buf: Optional[str] = None
+        self._hay_offsets: List[int] = []
+        # url -> position in self.data, for O(1) duplicate detection
+        self._url_index: Dict[str, int] = {}
+        # Stable runtime ids (not persisted): record lookups that survive reordering
+        self._next_id = 1
+        self._by_id: Dict[int, Dict[str, str]] = {}
+        self._pos_by_id: Dict[int, int] = {}
+        # Write-behind state: mutations mark dirty and coalesce into one save
+        self._dirty = False
+        self._save_timer: Optional[QTimer] = None
         self.load()
 
+    @staticmethod
+    def _hay_for(title: str, url: str) -> str:
+        return f"{title}\n{url}".lower()
+
+    def _new_record(self, title: str, url: str) -> Dict[str, str]:
+        # Interning collapses repeated titles/hosts to one object and lets
+        # equality checks short-circuit on identity
+        rec = {"id": self._next_id, "title": sys.intern(title), "url": sys.intern(url)}
+        self._by_id[self._next_id] = rec
+        self._next_id += 1
+        return rec
+
+    def _reindex(self) -> None:
+        self._url_index = {it["url"]: i for i, it in enumerate(self.data)}
+        self._pos_by_id = {it["id"]: i for i, it in enumerate(self.data)}
+
     def load(self) -> None:
         # Ensure folder exists even if called later
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
         if not self.path.exists():
-            self.data = []
+            self._reset_in_memory()
             return
 
         try:
-            raw = json.loads(self.path.read_text(encoding="utf-8") or "[]")
+            # Binary read: no intermediate decoded str copy of the whole file
+            if orjson and self.path.stat().st_size >= _MMAP_MIN_BYTES:
+                with self.path.open("rb") as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        mv = memoryview(mm)
+                        try:
+                            raw = orjson.loads(mv)
+                        finally:
+                            mv.release()
+                    finally:
+                        mm.close()
+            else:
+                with self.path.open("rb") as f:
+                    payload = f.read()
+                raw = (orjson.loads(payload) if orjson else json.loads(payload)) if payload else []
             if not isinstance(raw, list):
-                self.data = []
+                self._reset_in_memory()
                 return
 
+            self._reset_in_memory()
             out: List[Dict[str, str]] = []
+            hay: List[str] = []
             for it in raw:
                 if not isinstance(it, dict):
                     continue
                 title = str(it.get("title", "")).strip()
                 url = str(it.get("url", "")).strip()
                 if title and url:
-                    out.append({"title": title, "url": url})
+                    out.append(self._new_record(title, url))
+                    hay.append(self._hay_for(title, url))
             self.data = out
+            self._hay = hay
+            self._reindex()
         except Exception:
-            self.data = []
+            self._reset_in_memory()
+
+    def _reset_in_memory(self) -> None:
+        self.data = []
+        self._hay = []
+        self._hay_buf = None
+        self._url_index = {}
+        self._by_id = {}
+        self._pos_by_id = {}
+
+    def hay_buffer(self) -> Tuple[str, List[int]]:
+        """Return (concatenated haystacks, per-row start offsets + end sentinel).
+
+        Rows are joined with \\x1f, which never appears in typed queries, so a
+        match can't span two rows. Rebuilt lazily after mutations.
+        """
+        if self._hay_buf is None:
+            offsets: List[int] = []
+            pos = 0
+            for h in self._hay:
+                offsets.append(pos)
+                pos += len(h) + 1
+            offsets.append(pos)
+            self._hay_buf = ("\x1f".join(self._hay) + "\x1f") if self._hay else ""
+            self._hay_offsets = offsets
+        return self._hay_buf, self._hay_offsets
 
     def save(self) -> None:
+        """Write immediately: compact JSON to a temp file, then atomic replace."""
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(
-            json.dumps(self.data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        tmp = self.path.with_suffix(".json.tmp")
+        # ids are runtime-only; the on-disk format stays [{"title","url"}]
+        persisted = [{"title": it["title"], "url": it["url"]} for it in self.data]
+        if orjson:
+            tmp.write_bytes(orjson.dumps(persisted))
+        else:
+            tmp.write_text(
+                json.dumps(persisted, ensure_ascii=False, separators=(",", ":")),
+                encoding="utf-8",
+            )
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+    def schedule_save(self) -> None:
+        """Coalesce rapid mutations into a single write ~500ms after the last one."""
+        self._hay_buf = None  # every mutation passes through here; drop the stale buffer
+        self._dirty = True
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(500)
+            self._save_timer.timeout.connect(self.flush)
+        self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write any pending changes now (wired to QApplication.aboutToQuit)."""
+        if self._dirty:
+            self.save()
 
-    def add_link(self, title: str, url: str) -> None:
+    def add_link(self, title: str, url: str) -> Tuple[Optional[int], bool]:
+        """Add or retitle a link. Returns (affected index, True if newly added)."""
         title = (title or "").strip()
         url = (url or "").strip()
         if not title or not url:
-            return
-
-        # De-dupe by URL: update title if URL already exists
-        for it in self.data:
-            if (it.get("url") or "").strip() == url:
-                it["title"] = title
-                self.save()
-                return
-
-        self.data.append({"title": title, "url": url})
-        self.save()
+            return None, False
+
+        # De-dupe by URL: update title if URL already exists (O(1) index lookup)
+        existing = self._url_index.get(url)
+        if existing is not None:
+            it = self.data[existing]
+            if it["title"] == title:
+                # Identical pair re-added (e.g. a repeated paste): nothing to do,
+                # no haystack rebuild, no save scheduled
+                return existing, False
+            it["title"] = sys.intern(title)
+            self._hay[existing] = self._hay_for(title, it["url"])
+            self.schedule_save()
+            return existing, False
+
+        rec = self._new_record(title, url)
+        self.data.append(rec)
+        self._hay.append(self._hay_for(title, url))
+        self._url_index[url] = len(self.data) - 1
+        self._pos_by_id[rec["id"]] = len(self.data) - 1
+        self.schedule_save()
+        return len(self.data) - 1, True
 
     def remove_link(self, index: int) -> None:
         if 0 <= index < len(self.data):
-            self.data.pop(index)
-            self.save()
-
-    def update_link(self, index: int, title: str, url: str) -> bool:
-        """Update an existing link by index. Returns True if updated."""
+            rec = self.data.pop(index)
+            self._hay.pop(index)
+            self._by_id.pop(rec["id"], None)
+            self._reindex()  # removal is rare; positions after index all shift
+            self.schedule_save()
+
+    def clear(self) -> None:
+        self._reset_in_memory()
+        self.schedule_save()
+
+    def update_link(self, index: int, title: str, url: str) -> Optional[str]:
+        """Update an existing link by index.
+
+        Returns "updated" for an in-place edit, "merged" when the new URL
+        already existed elsewhere (that record wins, this one is removed),
+        or None on failure.
+        """
         if not (0 <= index < len(self.data)):
-            return False
+            return None
 
         title = (title or "").strip()
         url = (url or "").strip()
         if not title or not url:
-            return False
+            return None
 
         # If URL already exists elsewhere, update that record instead and remove this one.
-        for i, it in enumerate(self.data):
-            if i == index:
-                continue
-            if (it.get("url") or "").strip() == url:
-                it["title"] = title
-                # remove original index if it's a different item
-                self.data.pop(index)
-                self.save()
-                return True
-
-        self.data[index] = {"title": title, "url": url}
-        self.save()
-        return True
+        other = self._url_index.get(url)
+        if other is not None and other != index:
+            it = self.data[other]
+            it["title"] = sys.intern(title)
+            self._hay[other] = self._hay_for(title, it["url"])
+            # remove original index since it's a different item
+            dropped = self.data.pop(index)
+            self._hay.pop(index)
+            self._by_id.pop(dropped["id"], None)
+            self._reindex()
+            self.schedule_save()
+            return "merged"
+
+        rec = self.data[index]
+        old_url = rec["url"]
+        rec["title"] = sys.intern(title)
+        rec["url"] = sys.intern(url)
+        self._hay[index] = self._hay_for(title, url)
+        if old_url != url:
+            self._url_index.pop(old_url, None)
+            self._url_index[url] = index
+        self.schedule_save()
+        return "updated"
+
+
+class LinkListModel(QAbstractListModel):
+    """Read-only list model over LinkStorage with an integrated search filter.
+
+    Keeps a list of storage indices that pass the current filter; row data is
+    composed on demand, so off-screen rows never materialize strings.
+
+    Deliberately not a QStringListModel: that would push every row's text
+    across the C++ boundary on each refilter and still need a subclass for
+    tooltips and the stable-id role, while this model hands out only what the
+    viewport actually asks for.
+    """
+
+    def __init__(self, storage: LinkStorage, parent=None):
+        super().__init__(parent)
+        self._storage = storage
+        self._q = ""
+        self._rx_cache: Optional[Tuple[str, "re.Pattern[str]"]] = None
+        self._filtered_indices: List[int] = list(range(len(storage.data)))
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return len(self._filtered_indices)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if not (0 <= row < len(self._filtered_indices)):
+            return None
+        si = self._filtered_indices[row]
+        if si >= len(self._storage.data):
+            return None
+        it = self._storage.data[si]
+        if role == Qt.DisplayRole:
+            return f"{it['title']}\n{it['url']}"
+        if role == Qt.ToolTipRole:
+            return it["url"]
+        if role == Qt.UserRole:
+            # Stable record id: stays valid across filtering and removals
+            return it["id"]
+        return None
+
+    def set_filter(self, q: str) -> int:
+        """Re-filter against the pre-lowered haystacks; returns rows shown."""
+        hays = self._storage._hay
+        self._q = q
+        self.beginResetModel()
+        if q and " " in q:
+            # Multi-term query: match terms in order via one cached compiled
+            # regex per row (haystacks are pre-lowered, so no IGNORECASE)
+            rx = self._compiled_query(q)
+            self._filtered_indices = [i for i, h in enumerate(hays) if rx.search(h)]
+        elif q:
+            # One vectorized find over the joined buffer, hopping a row per hit
+            buf, offsets = self._storage.hay_buffer()
+            matches: List[int] = []
+            pos = buf.find(q)
+            while pos >= 0:
+                row = bisect.bisect_right(offsets, pos) - 1
+                matches.append(row)
+                pos = buf.find(q, offsets[row + 1])
+            self._filtered_indices = matches
+        else:
+            self._filtered_indices = list(range(len(hays)))
+        self.endResetModel()
+        return len(self._filtered_indices)
+
+    def _compiled_query(self, q: str) -> "re.Pattern[str]":
+        if self._rx_cache is not None and self._rx_cache[0] == q:
+            return self._rx_cache[1]
+        rx = re.compile(".*".join(re.escape(t) for t in q.split()), re.DOTALL)
+        self._rx_cache = (q, rx)
+        return rx
+
+    # --- Targeted single-row updates: avoid a full reset for O(1) mutations ---
+    # _filtered_indices is always ascending, so bisect finds a row in O(log N).
+
+    def _matches(self, hay: str) -> bool:
+        if not self._q:
+            return True
+        if " " in self._q:
+            return self._compiled_query(self._q).search(hay) is not None
+        return self._q in hay
+
+    def _row_of(self, si: int) -> Tuple[int, bool]:
+        pos = bisect.bisect_left(self._filtered_indices, si)
+        shown = pos < len(self._filtered_indices) and self._filtered_indices[pos] == si
+        return pos, shown
+
+    def notify_appended(self) -> None:
+        """The last storage row is new; show it if it matches the filter."""
+        si = len(self._storage.data) - 1
+        if not self._matches(self._storage._hay[si]):
+            return
+        row = len(self._filtered_indices)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._filtered_indices.append(si)
+        self.endInsertRows()
+
+    def notify_updated(self, si: int) -> None:
+        """Storage row si changed in place; patch just that row."""
+        matches = self._matches(self._storage._hay[si])
+        pos, shown = self._row_of(si)
+        if shown and matches:
+            idx = self.index(pos)
+            self.dataChanged.emit(idx, idx)
+        elif shown:
+            self.beginRemoveRows(QModelIndex(), pos, pos)
+            self._filtered_indices.pop(pos)
+            self.endRemoveRows()
+        elif matches:
+            self.beginInsertRows(QModelIndex(), pos, pos)
+            self._filtered_indices.insert(pos, si)
+            self.endInsertRows()
+
+    def notify_removed(self, si: int) -> None:
+        """Storage row si is gone; drop its row and shift later indices down."""
+        pos, shown = self._row_of(si)
+        if shown:
+            self.beginRemoveRows(QModelIndex(), pos, pos)
+            self._filtered_indices.pop(pos)
+            self.endRemoveRows()
+        for i in range(pos, len(self._filtered_indices)):
+            self._filtered_indices[i] -= 1
 
 
 class LinkManagerApp(LinkManagerUI):
@@ -172,10 +467,26 @@ class LinkManagerApp(LinkManagerUI):
         super().__init__()
         self.storage = LinkStorage()
 
+        # Make sure a coalesced (not-yet-written) save still lands on exit
+        QApplication.instance().aboutToQuit.connect(self.storage.flush)
+
+        # One reusable timer for transient status messages (no alloc per update)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(lambda: self.status_label.setText("Ready"))
+
         # Ensure right-click emits customContextMenuRequested
         self.list_widget.setContextMenuPolicy(Qt.CustomContextMenu)
 
         # Load existing links
+        self.model = LinkListModel(self.storage, self)
+        self.list_widget.setModel(self.model)
+
+        # Track the selected record id once per selection change, so every
+        # action (open/copy/edit/remove) skips the index.data() round-trip
+        self._current_id: Optional[int] = None
+        self.list_widget.selectionModel().currentChanged.connect(self._on_current_changed)
+
         self.refresh_list()
 
         # Connect signals
@@ -185,77 +496,62 @@ class LinkManagerApp(LinkManagerUI):
         self.copy_btn.clicked.connect(self.copy_selected_url)
         self.clear_inputs_btn.clicked.connect(self.clear_inputs)
         self.clear_all_btn.clicked.connect(self.clear_all)
-        self.search_input.textChanged.connect(self.refresh_list)
+
+        # Debounced search: rebuild once after the user pauses typing, not per keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self._on_search_timeout)
+        self.search_input.textChanged.connect(self._search_timer.start)
 
         self.title_input.returnPressed.connect(self.add_link)
         self.url_input.returnPressed.connect(self.add_link)
 
-        self.list_widget.itemDoubleClicked.connect(lambda *_: self.open_selected())
+        self.list_widget.activated.connect(lambda *_: self.open_selected())
         self.list_widget.customContextMenuRequested.connect(self._show_context_menu)
 
+        # The context menu is static; build it once and reuse it per right-click
+        self._context_menu = QMenu(self)
+        self._context_menu.addAction("Open", self.open_selected)
+        self._context_menu.addAction("Copy URL", self.copy_selected_url)
+        self._context_menu.addAction("Edit (load into fields)", self.edit_selected)
+        self._context_menu.addAction("Save Edit (update selected)", self.save_edit)
+        self._context_menu.addSeparator()
+        self._context_menu.addAction("Remove", self.remove_selected)
+
     def _set_status(self, text: str, timeout_ms: int = 0):
         self.status_label.setText(text)
         if timeout_ms and timeout_ms > 0:
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(timeout_ms, lambda: self.status_label.setText("Ready"))
-
-    def _normalize_url(self, url: str) -> str:
-        u = (url or "").strip()
-        if not u:
-            return ""
-        if "://" not in u:
-            u = "https://" + u
-        return u
-
-    def _current_item_data(self):
-        item = self.list_widget.currentItem()
-        if not item:
-            return None
-        payload = item.data(Qt.UserRole)
-        return payload if isinstance(payload, dict) else None
-
-    def _get_link_by_payload_index(self, payload: dict) -> Tuple[Optional[Dict[str, str]], Optional[int]]:
-        try:
-            idx = int(payload.get("index"))
-        except Exception:
-            return None, None
-        if idx < 0 or idx >= len(self.storage.data):
-            return None, idx
-        return self.storage.data[idx], idx
-
-    def refresh_list(self):
-        q = (self.search_input.text() or "").strip().lower()
+            self._status_timer.start(timeout_ms)
 
-        self.list_widget.clear()
-        shown = 0
+    def _on_current_changed(self, current, _previous):
+        lid = current.data(Qt.UserRole) if current.isValid() else None
+        self._current_id = lid if isinstance(lid, int) else None
 
-        # FIX: preserve real storage index when filtering
-        for real_idx in range(len(self.storage.data)):
-            item = self.storage.data[real_idx]
-            title = str(item.get("title", "")).strip()
-            url = str(item.get("url", "")).strip()
+    def _current_link_id(self) -> Optional[int]:
+        return self._current_id
 
-            hay = f"{title}\n{url}".lower()
-            if q and q not in hay:
-                continue
-
-            li = self._make_list_item(real_idx, title, url)
-            self.list_widget.addItem(li)
-            shown += 1
+    def _get_link_by_id(self, lid: int) -> Tuple[Optional[Dict[str, str]], Optional[int]]:
+        link = self.storage._by_id.get(lid)
+        if link is None:
+            return None, None
+        return link, self.storage._pos_by_id.get(lid)
 
-        self._set_status(f"Showing {shown} link(s). Total: {len(self.storage.data)}")
+    def _on_search_timeout(self):
+        # Edits that cancel out (trailing spaces, undone typing) leave the
+        # effective query unchanged; skip the model reset entirely.
+        q = (self.search_input.text() or "").strip().lower()
+        if q == self.model._q:
+            return
+        self.refresh_list()
 
-    def _make_list_item(self, idx: int, title: str, url: str):
-        # Compact-but-readable: title on top, URL below.
-        text = f"{title}\n{url}"
-        li = self._make_qitem(text)
-        li.setData(Qt.UserRole, {"index": idx, "title": title, "url": url})
-        li.setToolTip(url)
-        return li
+    def refresh_list(self):
+        q = (self.search_input.text() or "").strip().lower()
+        self.model.set_filter(q)
+        self._update_status_counts()
 
-    def _make_qitem(self, text: str):
-        from PySide6.QtWidgets import QListWidgetItem
-        return QListWidgetItem(text)
+    def _update_status_counts(self):
+        self._set_status(f"Showing {self.model.rowCount()} link(s). Total: {len(self.storage.data)}")
 
     def clear_inputs(self):
         self.title_input.clear()
@@ -265,7 +561,7 @@ class LinkManagerApp(LinkManagerUI):
 
     def add_link(self):
         title = (self.title_input.text() or "").strip()
-        url = self._normalize_url(self.url_input.text())
+        url = _normalize_url(self.url_input.text())
 
         if not title:
             QMessageBox.warning(self, "Missing title", "Please enter a title.")
@@ -276,15 +572,18 @@ class LinkManagerApp(LinkManagerUI):
             self.url_input.setFocus()
             return
 
-        # Basic URL sanity check
-        qurl = QUrl(url)
-        if not qurl.isValid() or qurl.scheme() not in ("http", "https"):
+        # Basic URL sanity check (memoized; repeated strings skip the QUrl parse)
+        if not _is_valid_http_url(url):
             QMessageBox.warning(self, "Invalid URL", "Please enter a valid http(s) URL.\n\nExample: https://example.com")
             self.url_input.setFocus()
             return
 
-        self.storage.add_link(title, url)
-        self.refresh_list()
+        affected, added = self.storage.add_link(title, url)
+        if added:
+            self.model.notify_appended()
+        elif affected is not None:
+            self.model.notify_updated(affected)
+        self._update_status_counts()
 
         self.title_input.clear()
         self.url_input.clear()
@@ -292,59 +591,54 @@ class LinkManagerApp(LinkManagerUI):
         self._set_status("Added.", 1500)
 
     def remove_selected(self):
-        payload = self._current_item_data()
-        if not payload:
+        lid = self._current_link_id()
+        if lid is None:
             QMessageBox.warning(self, "No selection", "Select a link first.")
             return
 
-        link, idx = self._get_link_by_payload_index(payload)
+        link, idx = self._get_link_by_id(lid)
         if link is None or idx is None:
             QMessageBox.warning(self, "Invalid selection", "That item no longer exists.")
             self.refresh_list()
             return
 
-        title = str(link.get("title") or "this link").strip() or "this link"
+        title = link["title"]
         if QMessageBox.question(self, "Remove link?", f"Remove “{title}”?") != QMessageBox.Yes:
             return
 
         self.storage.remove_link(idx)
-        self.refresh_list()
+        self.model.notify_removed(idx)
+        self._update_status_counts()
         self._set_status("Removed.", 1500)
 
     def open_selected(self):
-        payload = self._current_item_data()
-        if not payload:
+        lid = self._current_link_id()
+        if lid is None:
             QMessageBox.warning(self, "No selection", "Select a link first.")
             return
 
-        link, _idx = self._get_link_by_payload_index(payload)
+        link, _idx = self._get_link_by_id(lid)
         if link is None:
             QMessageBox.warning(self, "Invalid selection", "That item no longer exists.")
             self.refresh_list()
             return
 
-        url = str(link.get("url") or "").strip()
-        if not url:
-            return
-        QDesktopServices.openUrl(QUrl(url))
+        QDesktopServices.openUrl(QUrl(link["url"]))
         self._set_status("Opened in browser.", 1500)
 
     def copy_selected_url(self):
-        payload = self._current_item_data()
-        if not payload:
+        lid = self._current_link_id()
+        if lid is None:
             QMessageBox.warning(self, "No selection", "Select a link first.")
             return
 
-        link, _idx = self._get_link_by_payload_index(payload)
+        link, _idx = self._get_link_by_id(lid)
         if link is None:
             QMessageBox.warning(self, "Invalid selection", "That item no longer exists.")
             self.refresh_list()
             return
 
-        url = str(link.get("url") or "").strip()
-        if not url:
-            return
-        QApplication.clipboard().setText(url)
+        QApplication.clipboard().setText(link["url"])
         self._set_status("Copied URL.", 1500)
 
     def clear_all(self):
@@ -361,71 +655,51 @@ class LinkManagerApp(LinkManagerUI):
         ) != QMessageBox.Yes:
             return
 
-        self.storage.data = []
-        self.storage.save()
+        self.storage.clear()
         self.refresh_list()
         self._set_status("Cleared all links.", 2000)
 
     def _show_context_menu(self, pos):
-        item = self.list_widget.itemAt(pos)
-        if not item:
+        index = self.list_widget.indexAt(pos)
+        if not index.isValid():
             return
 
         # Ensure actions operate on the item that was right-clicked
-        self.list_widget.setCurrentItem(item)
-
-        menu = QMenu(self)
-        act_open = menu.addAction("Open")
-        act_copy = menu.addAction("Copy URL")
-        act_edit = menu.addAction("Edit (load into fields)")
-        act_save = menu.addAction("Save Edit (update selected)")
-        menu.addSeparator()
-        act_remove = menu.addAction("Remove")
-
-        chosen = menu.exec(self.list_widget.mapToGlobal(pos))
-        if chosen == act_open:
-            self.open_selected()
-        elif chosen == act_copy:
-            self.copy_selected_url()
-        elif chosen == act_edit:
-            self.edit_selected()
-        elif chosen == act_save:
-            self.save_edit()
-        elif chosen == act_remove:
-            self.remove_selected()
+        self.list_widget.setCurrentIndex(index)
+        self._context_menu.exec(self.list_widget.mapToGlobal(pos))
 
     def edit_selected(self):
-        payload = self._current_item_data()
-        if not payload:
+        lid = self._current_link_id()
+        if lid is None:
             QMessageBox.warning(self, "No selection", "Select a link first.")
             return
 
-        link, idx = self._get_link_by_payload_index(payload)
+        link, idx = self._get_link_by_id(lid)
         if link is None or idx is None:
             QMessageBox.warning(self, "Invalid selection", "That item no longer exists.")
             self.refresh_list()
             return
 
         # Prefill inputs with the selected link and focus URL for quick fixing
-        self.title_input.setText(str(link.get("title") or ""))
-        self.url_input.setText(str(link.get("url") or ""))
+        self.title_input.setText(link["title"])
+        self.url_input.setText(link["url"])
         self.url_input.setFocus()
         self._set_status("Editing selected link. Modify fields then choose “Save Edit”.", 4000)
 
     def save_edit(self):
-        payload = self._current_item_data()
-        if not payload:
+        lid = self._current_link_id()
+        if lid is None:
             QMessageBox.warning(self, "No selection", "Select a link to save edits.")
             return
 
-        link, idx = self._get_link_by_payload_index(payload)
+        link, idx = self._get_link_by_id(lid)
         if link is None or idx is None:
             QMessageBox.warning(self, "Invalid selection", "That item no longer exists.")
             self.refresh_list()
             return
 
         title = (self.title_input.text() or "").strip()
-        url = self._normalize_url(self.url_input.text())
+        url = _normalize_url(self.url_input.text())
 
         if not title:
             QMessageBox.warning(self, "Missing title", "Please enter a title.")
@@ -436,8 +710,7 @@ class LinkManagerApp(LinkManagerUI):
             self.url_input.setFocus()
             return
 
-        qurl = QUrl(url)
-        if not qurl.isValid() or qurl.scheme() not in ("http", "https"):
+        if not _is_valid_http_url(url):
             QMessageBox.warning(
                 self,
                 "Invalid URL",
@@ -446,11 +719,17 @@ class LinkManagerApp(LinkManagerUI):
             self.url_input.setFocus()
             return
 
-        if not self.storage.update_link(idx, title, url):
+        result = self.storage.update_link(idx, title, url)
+        if not result:
             QMessageBox.warning(self, "Update failed", "Could not update that link.")
             return
 
-        self.refresh_list()
+        if result == "merged":
+            # Two rows changed shape (one retitled, one removed); refilter fully.
+            self.refresh_list()
+        else:
+            self.model.notify_updated(idx)
+            self._update_status_counts()
         self._set_status("Saved edits.", 1500)
 
 if __name__ == "__main__":
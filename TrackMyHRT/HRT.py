@@ -1,13 +1,32 @@
+import itertools
 import json
 import os
 import sys
 import re
-import uuid  # <-- add
+import time
+
+try:
+    import orjson  # optional: much faster entry (de)serialization
+except ImportError:
+    orjson = None
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any
-
-from PySide6.QtCore import QDate, QTime, Qt
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QDate,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QStringListModel,
+    QThreadPool,
+    QTime,
+    QTimer,
+    Qt,
+    Signal,
+)
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QApplication,
@@ -27,8 +46,8 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QDoubleSpinBox,
     QPlainTextEdit,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyledItemDelegate,
+    QTableView,
     QTimeEdit,
     QVBoxLayout,
     QWidget,
@@ -49,6 +68,7 @@ APP_TITLE = "TrackMyHRT"
 org_name = "HRT Journey Tracker"
 DATA_FILENAME = "entries.json"  # <-- changed (was entries.jsonl)
 LEGACY_JSONL_FILENAME = "entries.jsonl"  # <-- add
+TOMBSTONES_FILENAME = "tombstones.txt"  # deleted entry ids, one per line
 STORAGE_DIRNAME = "storage"
 
 SETTINGS_THEME_KEY = "ui/theme"  # "dark" | "light"
@@ -59,7 +79,7 @@ DARK_STYLESHEET = """
 QWidget { background: #121212; color: #eaeaea; }
 QGroupBox { border: 1px solid #2a2a2a; margin-top: 10px; }
 QGroupBox::title { subcontrol-origin: margin; left: 8px; padding: 0 4px; color: #eaeaea; }
-QLineEdit, QPlainTextEdit, QDateEdit, QTimeEdit, QComboBox, QTableWidget {
+QLineEdit, QPlainTextEdit, QDateEdit, QTimeEdit, QComboBox, QTableView {
   background: #1b1b1b; color: #eaeaea; border: 1px solid #2a2a2a;
 }
 QHeaderView::section { background: #1b1b1b; color: #eaeaea; border: 1px solid #2a2a2a; padding: 4px; }
@@ -75,7 +95,7 @@ LIGHT_STYLESHEET = """
 QWidget { background: #f6f6f6; color: #111; }
 QGroupBox { border: 1px solid #d0d0d0; margin-top: 10px; }
 QGroupBox::title { subcontrol-origin: margin; left: 8px; padding: 0 4px; color: #111; }
-QLineEdit, QPlainTextEdit, QDateEdit, QTimeEdit, QComboBox, QTableWidget {
+QLineEdit, QPlainTextEdit, QDateEdit, QTimeEdit, QComboBox, QTableView {
   background: #ffffff; color: #111; border: 1px solid #cfcfcf;
 }
 QHeaderView::section { background: #efefef; color: #111; border: 1px solid #d0d0d0; padding: 4px; }
@@ -98,7 +118,53 @@ def _apply_app_theme(theme: str, settings: QSettings | None = None, persist: boo
         settings.setValue(SETTINGS_THEME_KEY, t)
     return t
 
-@dataclass
+# Fixed dropdown contents. Module-level so windows don't rebuild per-instance
+# copies; the shared QStringListModels below back every combo of a given kind.
+_UNIT_OPTIONS = ("", "mg", "mcg", "g", "mL", "IU", "patch", "pump", "tablet")
+_ROUTE_OPTIONS = ("", "Oral", "Sublingual", "Transdermal", "Injection (IM)", "Injection (SC)", "Topical", "Other")
+
+# --- change: move energetic/tired to energy; keep mood focused on mood ---
+_MOOD_OPTIONS = ("", "Calm", "Happy", "Anxious", "Irritable", "Low")
+_ENERGY_OPTIONS = ("", "Energetic", "Tired", "Normal", "Wired", "Exhausted")
+_SYMPTOM_OPTIONS = ("", "None", "Headache", "Nausea", "Hot flashes", "Dizziness", "Breast tenderness", "Cramps")
+_LIBIDO_OPTIONS = ("", "Very low", "Low", "Normal", "High", "Very high")
+# --- end change ---
+
+_MED_NAME_OPTIONS = (
+    "",
+    "Estradiol",
+    "Estradiol valerate",
+    "Estradiol cypionate",
+    "Ethinyl estradiol",
+    "Spironolactone",
+    "Cyproterone acetate",
+    "Bicalutamide",
+    "Finasteride",
+    "Dutasteride",
+    "Progesterone",
+    "Medroxyprogesterone",
+    "GnRH agonist",
+    "Other",
+)
+
+_DOSE_OPTIONS = (
+    "",
+    "0.5", "1", "2", "4", "6", "8",
+    "12.5", "25", "50", "100", "200",
+    "0.1", "0.2", "0.3", "0.4",
+)
+
+_OPTIONS_MODELS: Dict[tuple, QStringListModel] = {}
+
+def _options_model(options: tuple) -> QStringListModel:
+    """One shared QStringListModel per option set (needs a live QApplication)."""
+    model = _OPTIONS_MODELS.get(options)
+    if model is None:
+        model = QStringListModel(list(options), QApplication.instance())
+        _OPTIONS_MODELS[options] = model
+    return model
+
+@dataclass(frozen=True, slots=True)
 class MedicationRow:
     name: str
     dose: float
@@ -106,17 +172,19 @@ class MedicationRow:
     route: str
     time: str  # "HH:mm"
 
+@lru_cache(maxsize=1)
+def _base_dir() -> str:
+    # Next to this script (dev) or next to the packaged exe.
+    if getattr(sys, "frozen", False):
+        return os.path.dirname(os.path.abspath(sys.executable))
+    return os.path.dirname(os.path.abspath(__file__))
+
 def _ensure_storage_ready() -> str:
     """
     Ensures ./storage exists next to this script (dev) or next to the packaged exe.
     Returns full path to entries.json.
     """
-    if getattr(sys, "frozen", False):
-        base_dir = os.path.dirname(os.path.abspath(sys.executable))
-    else:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-
-    storage_dir = os.path.join(base_dir, STORAGE_DIRNAME)
+    storage_dir = os.path.join(_base_dir(), STORAGE_DIRNAME)
     os.makedirs(storage_dir, exist_ok=True)
 
     path = os.path.join(storage_dir, DATA_FILENAME)
@@ -126,135 +194,446 @@ def _ensure_storage_ready() -> str:
             f.write("[]")
     return path
 
+@lru_cache(maxsize=1)
 def _app_data_path() -> str:
     # Centralize the canonical storage location (JSON array file).
+    # Cached: the path never changes at runtime and this is called from every
+    # read/write hot path.
     return _ensure_storage_ready()
 
+@lru_cache(maxsize=1)
 def _legacy_jsonl_path() -> str:
-    if getattr(sys, "frozen", False):
-        base_dir = os.path.dirname(os.path.abspath(sys.executable))
-    else:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base_dir, STORAGE_DIRNAME, LEGACY_JSONL_FILENAME)
+    return os.path.join(_base_dir(), STORAGE_DIRNAME, LEGACY_JSONL_FILENAME)
+
+# Deletes append the entry id to a small sidecar instead of rewriting the
+# whole array; any full write folds them in, and loads compact once the
+# sidecar grows past this many ids.
+_TOMBSTONE_COMPACT_MIN = 16
+
+@lru_cache(maxsize=1)
+def _tombstones_path() -> str:
+    return os.path.join(_base_dir(), STORAGE_DIRNAME, TOMBSTONES_FILENAME)
+
+def _read_tombstones() -> set:
+    try:
+        with open(_tombstones_path(), "r", encoding="utf-8") as f:
+            return {ln.strip() for ln in f if ln.strip()}
+    except OSError:
+        return set()
+
+def _append_tombstone(entry_id: str) -> None:
+    with open(_tombstones_path(), "a", encoding="utf-8") as f:
+        f.write(entry_id + "\n")
+
+def _clear_tombstones() -> None:
+    try:
+        os.remove(_tombstones_path())
+    except OSError:
+        pass
+
+# On-disk schema version. v2 wraps the array as {"v": 2, "entries": [...]}
+# and guarantees every entry has an id, so loads can skip the id scan.
+_SCHEMA_VERSION = 2
+_ENTRIES_FILE_VERSION = 0  # version of the file we last read/wrote
 
 def _read_entries_json(path: str) -> List[Dict[str, Any]]:
+    global _ENTRIES_FILE_VERSION
+    _ENTRIES_FILE_VERSION = 0
     try:
         if not os.path.exists(path):
             return []
-        with open(path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
+        # One bulk read + one parse: json.load's incremental text decoding is
+        # measurably slower than handing loads the whole buffer.
+        with open(path, "rb") as f:
+            buf = f.read()
+        raw = orjson.loads(buf) if orjson is not None else json.loads(buf)
+        if isinstance(raw, dict):
+            # versioned wrapper
+            entries = raw.get("entries")
+            if isinstance(entries, list):
+                _ENTRIES_FILE_VERSION = int(raw.get("v") or 0)
+                return entries
+            return []
+        # legacy bare array (v0/v1)
         return raw if isinstance(raw, list) else []
     except Exception:
         return []
 
+def _public_entry(e: Any) -> Any:
+    # Derived, display-only fields live under "_"-prefixed keys on the cached
+    # dicts; keep them out of the data file and exports.
+    if not isinstance(e, dict):
+        return e
+    return {k: v for k, v in e.items() if not k.startswith("_")}
+
+def _dump_entries_bytes(entries: List[Dict[str, Any]], indent: bool = True, wrap: bool = False) -> bytes:
+    payload: Any = [_public_entry(e) for e in entries]
+    if wrap:
+        payload = {"v": _SCHEMA_VERSION, "entries": payload}
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(payload, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+# fdatasync skips the metadata flush fsync forces; Windows has no fdatasync.
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
 def _write_entries_json_atomic(path: str, entries: List[Dict[str, Any]]) -> None:
+    global _ENTRIES_FILE_VERSION
+    # Compact on-disk form (indented output is export-only) and sync before
+    # the rename so the atomic replace actually lands on disk.
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(entries, f, ensure_ascii=False, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(_dump_entries_bytes(entries, indent=False, wrap=True))
+        f.flush()
+        _fdatasync(f.fileno())
     os.replace(tmp, path)
+    _ENTRIES_FILE_VERSION = _SCHEMA_VERSION
+    # a full write already reflects every delete
+    _clear_tombstones()
+
+# Values that mean "no dose recorded" (0.0 hashes together with 0).
+_EMPTY_DOSE = frozenset((None, "", 0, 0.0))
+
+# Dose-text parsing: compiled once; the translate table folds the
+# comma-decimal fixup and whitespace removal into one C pass.
+_DOSE_RE = re.compile(r"[-+]?\d*\.?\d+")
+_DOSE_TRANS = str.maketrans({",": ".", " ": ""})
+
+
+@lru_cache(maxsize=256)
+def _parse_dose_text(dose_text: str) -> float:
+    """Parse a dose string ("2.5", "2,5 mg") to a float; '' -> 0.0.
+
+    Doses come from a short list of combo presets plus the odd typed value,
+    so the same strings recur constantly — cache the parse per string.
+    """
+    s = dose_text.translate(_DOSE_TRANS)
+    if not s:
+        return 0.0
+    m = _DOSE_RE.search(s)
+    if not m:
+        raise ValueError(f"Invalid dose: '{dose_text}'")
+    return float(m.group(0))
+
+def _fmt_dose(d: Any) -> str | None:
+    try:
+        if d in _EMPTY_DOSE:
+            return None
+    except TypeError:
+        # unhashable junk from a hand-edited file; show it as-is
+        return str(d)
+    try:
+        return f"{float(d):g}"
+    except Exception:
+        return str(d)
+
+def _med_line(m: Any) -> str:
+    """One display line for a med dict: 'Name 2 mg (Oral) @ 08:00'."""
+    if not isinstance(m, dict):
+        return ""
+    parts: List[str] = []
+    name = str(m.get("name") or "").strip()
+    if name:
+        parts.append(name)
+    dose = _fmt_dose(m.get("dose"))
+    if dose:
+        parts.append(dose)
+    unit = str(m.get("unit") or "").strip()
+    if unit:
+        parts.append(unit)
+    route = str(m.get("route") or "").strip()
+    if route:
+        parts.append(f"({route})")
+    mt = str(m.get("time") or "").strip()
+    if mt:
+        parts.append(f"@ {mt}")
+    return " ".join(parts)
+
+# --- add: list-or-string formatter (for backward compatibility) ---
+def _listish_to_text(val: Any) -> str:
+    if isinstance(val, list):
+        return ", ".join(str(x) for x in val if str(x).strip())
+    return str(val or "").strip()
+# --- end add ---
+
+def _meds_render(entry: Dict[str, Any]) -> List[str]:
+    """Per-med display lines, from the cached copy when the entry has one."""
+    lines = entry.get("_meds_render")
+    if lines is None:
+        meds = entry.get("medications")
+        lines = [ln for ln in (_med_line(m) for m in (meds if isinstance(meds, list) else [])) if ln]
+    return lines
+
+def _attach_display_fields(e: Dict[str, Any]) -> None:
+    meds = e.get("medications")
+    lines = [ln for ln in (_med_line(m) for m in meds) if ln] if isinstance(meds, list) else []
+    e["_meds_render"] = lines
+    e["_meds_summary"] = "; ".join(lines)
 
 def _ensure_entry_ids(entries: List[Dict[str, Any]]) -> bool:
     """
     Ensures every entry has an 'id'. Returns True if any entries changed.
     """
+    if _ENTRIES_FILE_VERSION >= _SCHEMA_VERSION:
+        # v2 files are written with ids in place; skip the scan
+        return False
     changed = False
     for e in entries:
-        if isinstance(e, dict) and not str(e.get("id") or "").strip():
-            e["id"] = uuid.uuid4().hex
-            # best-effort timestamps
-            ts = str(e.get("timestamp_local") or "").strip()
-            if ts and not e.get("created_at"):
+        if not isinstance(e, dict):
+            continue
+        eid = e.get("id")
+        if eid and str(eid).strip():
+            continue
+        e["id"] = _new_id()
+        # best-effort timestamps
+        ts = str(e.get("timestamp_local") or "").strip()
+        if ts:
+            if not e.get("created_at"):
                 e["created_at"] = ts
-            if ts and not e.get("updated_at"):
+            if not e.get("updated_at"):
                 e["updated_at"] = ts
-            changed = True
+        changed = True
     return changed
 
+@lru_cache(maxsize=1)
+def _migration_marker_path() -> str:
+    return os.path.join(_base_dir(), STORAGE_DIRNAME, ".jsonl_migrated")
+
+def _mark_migration_done() -> None:
+    try:
+        open(_migration_marker_path(), "w").close()
+    except OSError:
+        pass
+
 def _migrate_jsonl_to_json_if_needed() -> None:
     """
     One-time migration:
     - If entries.json is empty (or missing) and legacy entries.jsonl exists with data,
       convert jsonl lines into a JSON array with ids.
+    A zero-byte marker records completion so later startups skip the check
+    (previously this parsed the whole JSON file just to see it was non-empty).
     """
+    if os.path.exists(_migration_marker_path()):
+        return
+
     json_path = _app_data_path()
     existing = _read_entries_json(json_path)
     if existing:
+        _mark_migration_done()
         return
 
     legacy = _legacy_jsonl_path()
     if not os.path.exists(legacy):
+        _mark_migration_done()
         return
 
-    migrated: List[Dict[str, Any]] = []
     try:
-        with open(legacy, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    if isinstance(obj, dict):
-                        migrated.append(obj)
-                except json.JSONDecodeError:
-                    continue
+        with open(legacy, "rb") as f:
+            blob = f.read()
     except OSError:
         return
 
+    lines = [ln for ln in blob.split(b"\n") if ln.strip()]
+    loads = orjson.loads if orjson is not None else json.loads
+    migrated: List[Dict[str, Any]] = []
+    try:
+        # one parse over a synthesized array instead of one call per line
+        parsed = loads(b"[" + b",".join(lines) + b"]")
+        migrated = [obj for obj in parsed if isinstance(obj, dict)]
+    except ValueError:
+        # a corrupt line poisons the batched parse; salvage line by line
+        for ln in lines:
+            try:
+                obj = loads(ln)
+            except ValueError:
+                continue
+            if isinstance(obj, dict):
+                migrated.append(obj)
+
     if not migrated:
+        # legacy file had no usable rows; nothing will appear in it later
+        _mark_migration_done()
         return
 
     _ensure_entry_ids(migrated)
     _write_entries_json_atomic(json_path, migrated)
+    _mark_migration_done()
+
+# In-memory entry cache: the JSON array is parsed once, then deletes/upserts
+# mutate the cached list (with a dict-by-id index for O(1) lookup) and write
+# it back. Re-read only when the file mtime changes under us. While deferred
+# saves are pending (_ENTRIES_DIRTY) the cache is ahead of the file and is
+# always the source of truth.
+_ENTRIES_CACHE: List[Dict[str, Any]] | None = None
+_ENTRIES_BY_ID: Dict[str, int] = {}
+_ENTRIES_MTIME: float = -1.0
+_ENTRIES_DIRTY = False
+_ENTRIES_REVISION = 0  # bumped on every rebuild/mutation; views compare it
+
+_ID_COUNTER = itertools.count()
+
+def _new_id() -> str:
+    # Nanosecond-time prefix + pid + process-local counter: no urandom read
+    # per entry, ids still sort chronologically, and the counter breaks ties
+    # for ids minted within the same nanosecond tick.
+    return f"{time.time_ns():x}{os.getpid():04x}{next(_ID_COUNTER) & 0xFFFF:04x}"
+
+def _entry_ts(e: Dict[str, Any]) -> str:
+    # Sort key with a guaranteed default (operator.itemgetter has none).
+    return e.get("timestamp_local") or ""
+
+def _insert_sorted_desc(entries: List[Dict[str, Any]], entry: Dict[str, Any]) -> int:
+    """Binary-search insert into the newest-first list; returns the index."""
+    key = _entry_ts(entry)
+    lo, hi = 0, len(entries)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _entry_ts(entries[mid]) > key:
+            lo = mid + 1
+        else:
+            hi = mid
+    entries.insert(lo, entry)
+    return lo
+
+def _store_mtime(path: str) -> float:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return -1.0
+
+def _rebuild_entries_index() -> None:
+    _ENTRIES_BY_ID.clear()
+    for i, e in enumerate(_ENTRIES_CACHE or []):
+        eid = str(e.get("id") or "")
+        if eid:
+            _ENTRIES_BY_ID[eid] = i
+
+def _reindex_entries_from(start: int) -> None:
+    # After a removal only the positions at/after the hole shift; entries
+    # before it keep their index.
+    entries = _ENTRIES_CACHE or []
+    for i in range(start, len(entries)):
+        eid = str(entries[i].get("id") or "")
+        if eid:
+            _ENTRIES_BY_ID[eid] = i
 
 def _load_entries() -> List[Dict[str, Any]]:
+    global _ENTRIES_CACHE, _ENTRIES_MTIME, _ENTRIES_REVISION
     _migrate_jsonl_to_json_if_needed()
     path = _app_data_path()
+    mtime = _store_mtime(path)
+    if _ENTRIES_CACHE is not None and (_ENTRIES_DIRTY or mtime == _ENTRIES_MTIME):
+        return _ENTRIES_CACHE
+
     entries = _read_entries_json(path)
-    if _ensure_entry_ids(entries):
-        # persist ids if we had to add them
+    dead = _read_tombstones()
+    if dead:
+        entries = [e for e in entries if str(e.get("id") or "") not in dead]
+        if len(dead) >= _TOMBSTONE_COMPACT_MIN:
+            # fold accumulated deletes back into a clean array
+            try:
+                _write_entries_json_atomic(path, entries)
+                mtime = _store_mtime(path)
+            except OSError:
+                pass
+    if _ensure_entry_ids(entries) or (entries and _ENTRIES_FILE_VERSION < _SCHEMA_VERSION):
+        # persist ids / upgrade legacy bare-array files to the v2 wrapper
         try:
             _write_entries_json_atomic(path, entries)
+            mtime = _store_mtime(path)
         except OSError:
             pass
-    # newest-first
-    entries.sort(key=lambda e: (e.get("timestamp_local") or ""), reverse=True)
+    # newest-first; the cache stays in this order (upserts insert in place)
+    entries.sort(key=_entry_ts, reverse=True)
+
+    # derive display strings once per load, not per repaint
+    for e in entries:
+        if isinstance(e, dict):
+            _attach_display_fields(e)
+
+    _ENTRIES_CACHE = entries
+    _ENTRIES_MTIME = mtime
+    _ENTRIES_REVISION += 1
+    _rebuild_entries_index()
     return entries
 
+def _persist_entries_cache() -> None:
+    """Writes the cached list back and refreshes the stored mtime."""
+    global _ENTRIES_MTIME
+    path = _app_data_path()
+    _write_entries_json_atomic(path, _ENTRIES_CACHE or [])
+    _ENTRIES_MTIME = _store_mtime(path)
+
+def _flush_entries() -> None:
+    """Writes pending deferred saves; one disk sync covers the whole batch."""
+    global _ENTRIES_DIRTY
+    if not _ENTRIES_DIRTY:
+        return
+    _ENTRIES_DIRTY = False
+    try:
+        _persist_entries_cache()
+    except OSError:
+        _ENTRIES_DIRTY = True  # keep the batch; retry on the next flush
+        raise
+
+def _flush_entries_quiet() -> None:
+    try:
+        _flush_entries()
+    except OSError:
+        pass
+
 def _delete_entry_by_id(entry_id: str) -> bool:
+    global _ENTRIES_CACHE, _ENTRIES_REVISION
     if not entry_id:
         return False
-    path = _app_data_path()
-    entries = _read_entries_json(path)
-    before = len(entries)
-    entries = [e for e in entries if str(e.get("id") or "") != entry_id]
-    if len(entries) == before:
+    entries = _load_entries()
+    idx = _ENTRIES_BY_ID.pop(entry_id, None)
+    if idx is None:
         return False
-    _write_entries_json_atomic(path, entries)
+    del entries[idx]
+    _reindex_entries_from(idx)
+    _ENTRIES_REVISION += 1
+    # O(1) append to the sidecar instead of rewriting the whole array; the
+    # next full write (save or load-time compaction) folds it in.
+    try:
+        _append_tombstone(entry_id)
+    except OSError:
+        _ENTRIES_CACHE = None
+        raise
     return True
 
-def _upsert_entry(updated: Dict[str, Any]) -> None:
+def _upsert_entry(updated: Dict[str, Any], defer: bool = False) -> None:
     """
     Insert if id not found; replace if id found.
+    With defer=True the write is left to the next _flush_entries call so
+    rapid consecutive saves coalesce into one disk sync.
     """
-    path = _app_data_path()
-    entries = _read_entries_json(path)
+    global _ENTRIES_DIRTY, _ENTRIES_REVISION
+    entries = _load_entries()
 
     entry_id = str(updated.get("id") or "").strip()
     if not entry_id:
-        entry_id = uuid.uuid4().hex
+        entry_id = _new_id()
         updated["id"] = entry_id
 
-    replaced = False
-    for i, e in enumerate(entries):
-        if str(e.get("id") or "") == entry_id:
-            entries[i] = updated
-            replaced = True
-            break
-    if not replaced:
-        entries.append(updated)
+    _attach_display_fields(updated)
+    idx = _ENTRIES_BY_ID.get(entry_id)
+    if idx is not None and _entry_ts(entries[idx]) == _entry_ts(updated):
+        entries[idx] = updated
+    elif idx is not None:
+        # timestamp changed: move the entry to its new sorted slot
+        del entries[idx]
+        pos = _insert_sorted_desc(entries, updated)
+        _reindex_entries_from(min(idx, pos))
+    else:
+        pos = _insert_sorted_desc(entries, updated)
+        _reindex_entries_from(pos)
 
-    _write_entries_json_atomic(path, entries)
+    _ENTRIES_REVISION += 1
+    if defer:
+        _ENTRIES_DIRTY = True
+    else:
+        _persist_entries_cache()
 
 # --- add: multi-select combo widget (checklist dropdown) ---
 class MultiSelectCombo(QToolButton):
@@ -267,13 +646,18 @@ class MultiSelectCombo(QToolButton):
         # allow clicking menu items without auto-closing
         self._menu.installEventFilter(self)
 
+        # one dataChanged per option during construction buys nothing; build
+        # the rows silently, append them in one model call, and sync the
+        # button text once at the end
+        self._model.blockSignals(True)
+        items: List[QStandardItem] = []
         for opt in options:
             if not opt:
                 continue
             item = QStandardItem(opt)
             item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
             item.setData(Qt.Unchecked, Qt.CheckStateRole)
-            self._model.appendRow(item)
+            items.append(item)
 
             act = QWidgetAction(self._menu)
             cb = QToolButton(self._menu)
@@ -284,6 +668,9 @@ class MultiSelectCombo(QToolButton):
             cb.clicked.connect(lambda checked, it=item: self._toggle_item(it, checked))
             act.setDefaultWidget(cb)
             self._menu.addAction(act)
+        if items:
+            self._model.appendColumn(items)
+        self._model.blockSignals(False)
 
         self.setMenu(self._menu)
         self.setPopupMode(QToolButton.InstantPopup)
@@ -312,11 +699,14 @@ class MultiSelectCombo(QToolButton):
 
     def set_values(self, values: List[str]):
         wanted = set((v or "").strip() for v in (values or []) if (v or "").strip())
+        # bulk update: silence per-row dataChanged, sync text once below
+        self._model.blockSignals(True)
         for r in range(self._model.rowCount()):
             it = self._model.item(r)
             if not it:
                 continue
             it.setData(Qt.Checked if it.text() in wanted else Qt.Unchecked, Qt.CheckStateRole)
+        self._model.blockSignals(False)
         for act in self._menu.actions():
             if isinstance(act, QWidgetAction):
                 w = act.defaultWidget()
@@ -349,23 +739,94 @@ class CalendarDialog(QDialog):
     def selected_date(self) -> QDate:
         return self.calendar.selectedDate()
 
+class EntriesModel(QAbstractTableModel):
+    """
+    Read-only table model over the cached entries.
+
+    Display strings are built once per reset into parallel row tuples; the
+    view only asks for visible cells, so no per-cell item objects exist
+    (QTableWidget allocates five QTableWidgetItems per row).
+    """
+
+    HEADERS = ("Timestamp", "Medications", "Mood", "Symptoms", "Notes")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[tuple] = []
+
+    def set_entries(self, entries: List[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._rows = [
+            (
+                str(e.get("timestamp_local") or ""),
+                e.get("_meds_summary") or "",
+                _listish_to_text(e.get("mood")),
+                _listish_to_text(e.get("symptoms")),
+                str(e.get("notes") or ""),
+            )
+            for e in entries
+        ]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole and index.column() == 0:
+            return int(Qt.AlignCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+class _ExportSignals(QObject):
+    finished = Signal(str)  # destination path
+    failed = Signal(str)    # error text
+
+class _ExportWorker(QRunnable):
+    """Runs the serialize-and-write part of an export off the GUI thread."""
+
+    def __init__(self, write_fn, out_path: str):
+        super().__init__()
+        self._write_fn = write_fn
+        self._out_path = out_path
+        self.signals = _ExportSignals()
+
+    def run(self):
+        try:
+            self._write_fn()
+        except OSError as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(self._out_path)
+
 class ViewEntriesDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("View entries")
         self.setModal(True)
 
-        self.table = QTableWidget(0, 5, self)
-        self.table.setHorizontalHeaderLabels(["Timestamp", "Medications", "Mood", "Symptoms", "Notes"])
+        self._model = EntriesModel(self)
+        self.table = QTableView(self)
+        self.table.setModel(self._model)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Stretch)
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
         self.table.setAlternatingRowColors(True)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
 
         # Simple usability: double-click row to open full view
         self.table.doubleClicked.connect(self._view_selected)
@@ -406,64 +867,26 @@ class ViewEntriesDialog(QDialog):
         self.setLayout(layout)
 
         self._entries: List[Dict[str, Any]] = []
+        self._shown_revision = -1
         self._refresh()
 
     def _load_entries(self) -> List[Dict[str, Any]]:
         return _load_entries()
 
-    def _meds_summary(self, meds: Any) -> str:
-        if not isinstance(meds, list):
-            return ""
-        parts: List[str] = []
-        for m in meds:
-            if not isinstance(m, dict):
-                continue
-            name = (m.get("name") or "").strip()
-            dose = m.get("dose")
-            unit = (m.get("unit") or "").strip()
-            route = (m.get("route") or "").strip()
-            time = (m.get("time") or "").strip()
-
-            s = name
-            if dose not in (None, "", 0, 0.0):
-                s = f"{s} {dose:g}"
-            if unit:
-                s = f"{s} {unit}"
-            if route:
-                s = f"{s} ({route})"
-            if time:
-                s = f"{s} @ {time}"
-            s = s.strip()
-            if s:
-                parts.append(s)
-        return "; ".join(parts)
-
-    # --- add: list-or-string formatter (for backward compatibility) ---
-    def _listish_to_text(self, val: Any) -> str:
-        if isinstance(val, list):
-            return ", ".join(str(x) for x in val if str(x).strip())
-        return str(val or "").strip()
-    # --- end add ---
-
     def _refresh(self):
         self._entries = self._load_entries()
-        self.table.setRowCount(0)
-
-        for entry in self._entries:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
+        self._redraw_table()
 
-            ts = str(entry.get("timestamp_local") or "")
-            meds = self._meds_summary(entry.get("medications"))
-            mood = self._listish_to_text(entry.get("mood"))
-            symptoms = self._listish_to_text(entry.get("symptoms"))
-            notes = str(entry.get("notes") or "")
+    def maybe_refresh(self):
+        """Reload only if entries changed since the dialog last drew them."""
+        if self._shown_revision != _ENTRIES_REVISION:
+            self._refresh()
 
-            for col, text in enumerate([ts, meds, mood, symptoms, notes]):
-                item = QTableWidgetItem(text)
-                if col == 0:
-                    item.setTextAlignment(Qt.AlignCenter)
-                self.table.setItem(row, col, item)
+    def _redraw_table(self):
+        # One model reset covers the whole reload; the view materializes only
+        # the visible rows.
+        self._model.set_entries(self._entries)
+        self._shown_revision = _ENTRIES_REVISION
 
     def _selected_entry(self) -> Dict[str, Any] | None:
         sel = self.table.selectionModel().selectedRows()
@@ -505,13 +928,15 @@ class ViewEntriesDialog(QDialog):
             return
 
         QMessageBox.information(self, "Deleted", "Entry deleted.")
-        self._refresh()
+        # _delete_entry_by_id mutated the shared cache (self._entries is the
+        # same list), so redraw without another load.
+        self._redraw_table()
 
     def _show_details(self):
         entry = self._selected_entry()
         if not entry:
             return
-        QMessageBox.information(self, "Entry details", json.dumps(entry, ensure_ascii=False, indent=2))
+        QMessageBox.information(self, "Entry details", json.dumps(_public_entry(entry), ensure_ascii=False, indent=2))
 
     def _format_entry_plain_text(self, entry: Dict[str, Any]) -> str:
         ts = str(entry.get("timestamp_local") or "").strip()
@@ -519,73 +944,37 @@ class ViewEntriesDialog(QDialog):
         time = str(entry.get("time") or "").strip()
 
         # --- change: support list-or-string fields + include energy ---
-        mood = self._listish_to_text(entry.get("mood"))
-        energy = self._listish_to_text(entry.get("energy"))
-        symptoms = self._listish_to_text(entry.get("symptoms"))
-        libido = self._listish_to_text(entry.get("libido"))
+        mood = _listish_to_text(entry.get("mood"))
+        energy = _listish_to_text(entry.get("energy"))
+        symptoms = _listish_to_text(entry.get("symptoms"))
+        libido = _listish_to_text(entry.get("libido"))
         # --- end change ---
 
         notes = str(entry.get("notes") or "").rstrip()
 
-        lines: List[str] = []
-        lines.append("Entry")
-        lines.append("=" * 40)
-        if ts:
-            lines.append(f"Timestamp: {ts}")
-        if date:
-            lines.append(f"Date:      {date}")
-        if time:
-            lines.append(f"Time:      {time}")
-        lines.append("")
-
-        lines.append("Medications")
-        lines.append("-" * 40)
-        meds = entry.get("medications")
-        if isinstance(meds, list) and meds:
-            for m in meds:
-                if not isinstance(m, dict):
-                    continue
-                name = str(m.get("name") or "").strip()
-                dose = m.get("dose")
-                unit = str(m.get("unit") or "").strip()
-                route = str(m.get("route") or "").strip()
-                mt = str(m.get("time") or "").strip()
-
-                parts: List[str] = []
-                if name:
-                    parts.append(name)
-                if dose not in (None, "", 0, 0.0):
-                    try:
-                        parts.append(f"{float(dose):g}")
-                    except Exception:
-                        parts.append(str(dose))
-                if unit:
-                    parts.append(unit)
-                if route:
-                    parts.append(f"({route})")
-                if mt:
-                    parts.append(f"@ {mt}")
-
-                line = " ".join(parts).strip()
-                if line:
-                    lines.append(f"- {line}")
-        else:
-            lines.append("- (none)")
-        lines.append("")
-
-        lines.append("Mood / Symptoms")
-        lines.append("-" * 40)
-        lines.append(f"Mood:     {mood if mood else '(none)'}")
-        lines.append(f"Energy:   {energy if energy else '(none)'}")
-        lines.append(f"Symptoms: {symptoms if symptoms else '(none)'}")
-        lines.append(f"Libido:   {libido if libido else '(none)'}")
-        lines.append("")
-
-        lines.append("Notes")
-        lines.append("-" * 40)
-        lines.append(notes if notes else "(none)")
+        med_lines = _meds_render(entry)
+        meds_block = "\n".join(f"- {ln}" for ln in med_lines) if med_lines else "- (none)"
 
-        return "\n".join(lines)
+        # One concatenation instead of dozens of list appends per entry.
+        return (
+            "Entry\n"
+            + "=" * 40 + "\n"
+            + (f"Timestamp: {ts}\n" if ts else "")
+            + (f"Date:      {date}\n" if date else "")
+            + (f"Time:      {time}\n" if time else "")
+            + "\nMedications\n"
+            + "-" * 40 + "\n"
+            + meds_block
+            + "\n\nMood / Symptoms\n"
+            + "-" * 40 + "\n"
+            + f"Mood:     {mood if mood else '(none)'}\n"
+            + f"Energy:   {energy if energy else '(none)'}\n"
+            + f"Symptoms: {symptoms if symptoms else '(none)'}\n"
+            + f"Libido:   {libido if libido else '(none)'}\n"
+            + "\nNotes\n"
+            + "-" * 40 + "\n"
+            + (notes if notes else "(none)")
+        )
 
     def _view_selected(self):
         entry = self._selected_entry()
@@ -615,116 +1004,24 @@ class ViewEntriesDialog(QDialog):
         dlg.exec()
 
     def _format_entry_txt(self, entry: Dict[str, Any]) -> str:
-        ts = str(entry.get("timestamp_local") or "").strip()
-        date = str(entry.get("date") or "").strip()
-        time = str(entry.get("time") or "").strip()
-
-        # --- change: support list-or-string fields + include energy ---
-        mood = self._listish_to_text(entry.get("mood"))
-        energy = self._listish_to_text(entry.get("energy"))
-        symptoms = self._listish_to_text(entry.get("symptoms"))
-        libido = self._listish_to_text(entry.get("libido"))
-        # --- end change ---
-
-        notes = str(entry.get("notes") or "").rstrip()
-
-        meds_lines: List[str] = []
-        meds = entry.get("medications")
-        if isinstance(meds, list) and meds:
-            for m in meds:
-                if not isinstance(m, dict):
-                    continue
-                name = str(m.get("name") or "").strip()
-                dose = m.get("dose")
-                unit = str(m.get("unit") or "").strip()
-                route = str(m.get("route") or "").strip()
-                mt = str(m.get("time") or "").strip()
-
-                parts: List[str] = []
-                if name:
-                    parts.append(name)
-                if dose not in (None, "", 0, 0.0):
-                    try:
-                        parts.append(f"{float(dose):g}")
-                    except Exception:
-                        parts.append(str(dose))
-                if unit:
-                    parts.append(unit)
-                if route:
-                    parts.append(f"({route})")
-                if mt:
-                    parts.append(f"@ {mt}")
-                line = " ".join(parts).strip()
-                if line:
-                    meds_lines.append(f"- {line}")
-
-        if not meds_lines:
-            meds_lines = ["- (none)"]
-
-        parts = [
-            "Entry",
-            "=" * 40,
-            f"Timestamp: {ts}" if ts else None,
-            f"Date:      {date}" if date else None,
-            f"Time:      {time}" if time else None,
-            "",
-            "Medications",
-            "-" * 40,
-            *meds_lines,
-            "",
-            "Mood / Symptoms",
-            "-" * 40,
-            f"Mood:     {mood if mood else '(none)'}",
-            f"Energy:   {energy if energy else '(none)'}",
-            f"Symptoms: {symptoms if symptoms else '(none)'}",
-            f"Libido:   {libido if libido else '(none)'}",
-            "",
-            "Notes",
-            "-" * 40,
-            notes if notes else "(none)",
-        ]
-        return "\n".join([p for p in parts if p is not None])
+        # After the formatter consolidation the TXT layout is identical to the
+        # full-view layout; keep the name for the export call sites.
+        return self._format_entry_plain_text(entry)
 
     def _format_entry_md(self, entry: Dict[str, Any]) -> str:
         ts = str(entry.get("timestamp_local") or "").strip()
         date = str(entry.get("date") or "").strip() or (ts.split(" ")[0] if ts else "")
 
         # --- change: support list-or-string fields + include energy ---
-        mood = self._listish_to_text(entry.get("mood"))
-        energy = self._listish_to_text(entry.get("energy"))
-        symptoms = self._listish_to_text(entry.get("symptoms"))
-        libido = self._listish_to_text(entry.get("libido"))
+        mood = _listish_to_text(entry.get("mood"))
+        energy = _listish_to_text(entry.get("energy"))
+        symptoms = _listish_to_text(entry.get("symptoms"))
+        libido = _listish_to_text(entry.get("libido"))
         # --- end change ---
 
         notes = (str(entry.get("notes") or "")).rstrip() or "(none)"
 
-        meds = entry.get("medications")
-        meds_lines: List[str] = []
-        if isinstance(meds, list) and meds:
-            for m in meds:
-                if not isinstance(m, dict):
-                    continue
-                name = str(m.get("name") or "").strip()
-                dose = m.get("dose")
-                unit = str(m.get("unit") or "").strip()
-                route = str(m.get("route") or "").strip()
-                mt = str(m.get("time") or "").strip()
-
-                s = name
-                if dose not in (None, "", 0, 0.0):
-                    try:
-                        s = f"{s} {float(dose):g}"
-                    except Exception:
-                        s = f"{s} {dose}"
-                if unit:
-                    s = f"{s} {unit}"
-                if route:
-                    s = f"{s} ({route})"
-                if mt:
-                    s = f"{s} @ {mt}"
-                s = s.strip()
-                if s:
-                    meds_lines.append(f"- {s}")
+        meds_lines = [f"- {ln}" for ln in _meds_render(entry)]
         if not meds_lines:
             meds_lines = ["- (none)"]
 
@@ -775,29 +1072,57 @@ class ViewEntriesDialog(QDialog):
 
         ext = os.path.splitext(out_path)[1].lower()
 
-        try:
+        def write_export():
+            # Plain-dict entries only; no widget access from the worker.
+            # Stream one entry at a time through a buffered handle so peak
+            # memory stays at one entry, not the whole payload.
             if ext == ".jsonl":
                 # Stored format is JSON array; generate JSONL export from entries.
-                with open(out_path, "w", encoding="utf-8") as f:
-                    for e in entries:
-                        f.write(json.dumps(e, ensure_ascii=False) + "\n")
+                with open(out_path, "wb", buffering=1 << 20) as f:
+                    if orjson is not None:
+                        for e in entries:
+                            f.write(orjson.dumps(_public_entry(e)))
+                            f.write(b"\n")
+                    else:
+                        for e in entries:
+                            f.write(json.dumps(_public_entry(e), ensure_ascii=False).encode("utf-8"))
+                            f.write(b"\n")
             elif ext == ".json":
-                with open(out_path, "w", encoding="utf-8") as f:
-                    json.dump(entries, f, indent=2, ensure_ascii=False)
+                with open(out_path, "wb") as f:
+                    f.write(_dump_entries_bytes(entries))
             elif ext == ".md":
-                md = "# TrackMyHRT export\n\n" + "\n\n".join(self._format_entry_md(e) for e in entries) + "\n"
-                with open(out_path, "w", encoding="utf-8") as f:
-                    f.write(md)
+                with open(out_path, "wb", buffering=1 << 20) as f:
+                    f.write(b"# TrackMyHRT export\n\n")
+                    for i, e in enumerate(entries):
+                        if i:
+                            f.write(b"\n\n")
+                        f.write(self._format_entry_md(e).encode("utf-8"))
+                    f.write(b"\n")
             else:
-                txt = "\n\n".join(self._format_entry_txt(e) for e in entries) + "\n"
-                with open(out_path, "w", encoding="utf-8") as f:
-                    f.write(txt)
-        except OSError as e:
-            QMessageBox.critical(self, "Export failed", f"Could not export:\n{e}")
-            return
-
+                with open(out_path, "wb", buffering=1 << 20) as f:
+                    for i, e in enumerate(entries):
+                        if i:
+                            f.write(b"\n\n")
+                        f.write(self._format_entry_txt(e).encode("utf-8"))
+                    f.write(b"\n")
+
+        # Serialize + write off the GUI thread so big histories don't freeze
+        # the dialog; signals hop back to this thread for the message boxes.
+        worker = _ExportWorker(write_export, out_path)
+        worker.signals.finished.connect(self._on_export_done)
+        worker.signals.failed.connect(self._on_export_failed)
+        self._export_worker = worker  # keep the signal holder alive
+        self.export_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_export_done(self, out_path: str):
+        self.export_btn.setEnabled(True)
         QMessageBox.information(self, "Exported", f"Exported to:\n{out_path}")
 
+    def _on_export_failed(self, err: str):
+        self.export_btn.setEnabled(True)
+        QMessageBox.critical(self, "Export failed", f"Could not export:\n{err}")
+
 class HelpDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -852,6 +1177,116 @@ class HelpDialog(QDialog):
 
         self.resize(760, 520)
 
+class MedsTableModel(QAbstractTableModel):
+    """
+    Editable model behind the medications grid. Rows are plain 5-string lists
+    (name/dose/unit/route/time); combos exist only while a cell is being
+    edited (see MedComboDelegate), not four persistent widgets per row.
+    """
+
+    HEADERS = ("Name", "Dose", "Unit", "Route", "Time")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[List[str]] = []
+
+    def rows(self) -> List[List[str]]:
+        return self._rows
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._rows[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole and index.column() == 4:
+            return int(Qt.AlignCenter)
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = str(value or "")
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def append_row(self, time_str: str) -> int:
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(["", "", "", "", time_str])
+        self.endInsertRows()
+        return row
+
+    def remove_rows(self, rows: List[int]) -> None:
+        if not rows:
+            return
+        # Coalesce contiguous selections so the view relayouts once per block
+        # instead of once per row.
+        ordered = sorted(set(rows), reverse=True)
+        end = start = ordered[0]
+        for r in ordered[1:]:
+            if r == start - 1:
+                start = r
+                continue
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self._rows[start:end + 1]
+            self.endRemoveRows()
+            end = start = r
+        self.beginRemoveRows(QModelIndex(), start, end)
+        del self._rows[start:end + 1]
+        self.endRemoveRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+class MedComboDelegate(QStyledItemDelegate):
+    """Pops an editable combo only when a cell is actually edited."""
+
+    _COLUMN_OPTIONS = {
+        0: _MED_NAME_OPTIONS,
+        1: _DOSE_OPTIONS,
+        2: _UNIT_OPTIONS,
+        3: _ROUTE_OPTIONS,
+    }
+
+    def createEditor(self, parent, option, index):
+        options = self._COLUMN_OPTIONS.get(index.column())
+        if options is None:
+            # time column: default line edit
+            return super().createEditor(parent, option, index)
+        cb = QComboBox(parent)
+        cb.setEditable(True)
+        cb.setModel(_options_model(options))
+        cb.setInsertPolicy(QComboBox.NoInsert)
+        return cb
+
+    def setEditorData(self, editor, index):
+        if isinstance(editor, QComboBox):
+            editor.setCurrentText(str(index.data(Qt.EditRole) or ""))
+        else:
+            super().setEditorData(editor, index)
+
+    def setModelData(self, editor, model, index):
+        if isinstance(editor, QComboBox):
+            model.setData(index, editor.currentText(), Qt.EditRole)
+        else:
+            super().setModelData(editor, model, index)
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -878,6 +1313,10 @@ class MainWindow(QMainWindow):
         self.time_edit.setDisplayFormat("HH:mm")
         self.time_edit.setTime(QTime.currentTime())
         self.time_edit.setToolTip("Entry time")
+        # keep the formatted time as a plain string so row adds and saves
+        # don't re-cross into Qt to format it
+        self._default_time_str = self.time_edit.time().toString("HH:mm")
+        self.time_edit.timeChanged.connect(self._on_time_changed)
 
         self.now_btn = QPushButton("Now", self)
         self.now_btn.setToolTip("Set date/time to current")
@@ -904,13 +1343,15 @@ class MainWindow(QMainWindow):
         dt_layout.addLayout(top_row)
         dt_group.setLayout(dt_layout)
 
-        self.meds_table = QTableWidget(0, 5, self)
-        self.meds_table.setHorizontalHeaderLabels(["Name", "Dose", "Unit", "Route", "Time"])
+        self.meds_model = MedsTableModel(self)
+        self.meds_table = QTableView(self)
+        self.meds_table.setModel(self.meds_model)
+        self.meds_table.setItemDelegate(MedComboDelegate(self.meds_table))
         self.meds_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         for col in (1, 2, 3, 4):
             self.meds_table.horizontalHeader().setSectionResizeMode(col, QHeaderView.ResizeToContents)
         self.meds_table.verticalHeader().setVisible(False)
-        self.meds_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.meds_table.setSelectionBehavior(QTableView.SelectRows)
         self.meds_table.setAlternatingRowColors(True)
 
         self.add_med_btn = QPushButton("Add medication", self)
@@ -933,58 +1374,24 @@ class MainWindow(QMainWindow):
         meds_layout.addLayout(meds_btns)
         meds_group.setLayout(meds_layout)
 
-        self.unit_options = ["", "mg", "mcg", "g", "mL", "IU", "patch", "pump", "tablet"]
-        self.route_options = ["", "Oral", "Sublingual", "Transdermal", "Injection (IM)", "Injection (SC)", "Topical", "Other"]
-
-        # --- change: move energetic/tired to energy; keep mood focused on mood ---
-        self.mood_options = ["", "Calm", "Happy", "Anxious", "Irritable", "Low"]
-        self.energy_options = ["", "Energetic", "Tired", "Normal", "Wired", "Exhausted"]
-        self.symptom_options = ["", "None", "Headache", "Nausea", "Hot flashes", "Dizziness", "Breast tenderness", "Cramps"]
-        self.libido_options = ["", "Very low", "Low", "Normal", "High", "Very high"]
-        # --- end change ---
-
-        self.med_name_options = [
-            "",
-            "Estradiol",
-            "Estradiol valerate",
-            "Estradiol cypionate",
-            "Ethinyl estradiol",
-            "Spironolactone",
-            "Cyproterone acetate",
-            "Bicalutamide",
-            "Finasteride",
-            "Dutasteride",
-            "Progesterone",
-            "Medroxyprogesterone",
-            "GnRH agonist",
-            "Other",
-        ]
-
-        self.dose_options = [
-            "",
-            "0.5", "1", "2", "4", "6", "8",
-            "12.5", "25", "50", "100", "200",
-            "0.1", "0.2", "0.3", "0.4",
-        ]
-
         # --- change: make mood/energy/libido look/work like symptoms (MultiSelectCombo) ---
         self.mood_edit = MultiSelectCombo(
-            [s for s in self.mood_options if s],
+            [s for s in _MOOD_OPTIONS if s],
             placeholder="Select mood(s) (optional)",
             parent=self,
         )
         self.energy_edit = MultiSelectCombo(
-            [s for s in self.energy_options if s],
+            [s for s in _ENERGY_OPTIONS if s],
             placeholder="Select energy (optional)",
             parent=self,
         )
         self.symptoms_edit = MultiSelectCombo(
-            [s for s in self.symptom_options if s and s != "None"],
+            [s for s in _SYMPTOM_OPTIONS if s and s != "None"],
             placeholder="Select symptom(s) (optional)",
             parent=self,
         )
         self.libido_edit = MultiSelectCombo(
-            [s for s in self.libido_options if s],
+            [s for s in _LIBIDO_OPTIONS if s],
             placeholder="Select libido (optional)",
             parent=self,
         )
@@ -1064,7 +1471,28 @@ class MainWindow(QMainWindow):
 
         self._add_med_row()
         self.meds_table.clearSelection()
-        self.meds_table.setCurrentCell(-1, -1)
+        self.meds_table.setCurrentIndex(QModelIndex())
+
+        # dialogs are built on first use and reused across invocations
+        self._view_dlg: ViewEntriesDialog | None = None
+        self._help_dlg: HelpDialog | None = None
+
+        # write-behind: batch rapid saves into one disk write/sync
+        self._save_flush_timer = QTimer(self)
+        self._save_flush_timer.setSingleShot(True)
+        self._save_flush_timer.setInterval(500)
+        self._save_flush_timer.timeout.connect(self._flush_pending_saves)
+
+    def _flush_pending_saves(self):
+        try:
+            _flush_entries()
+        except OSError as e:
+            QMessageBox.critical(self, "Save failed", f"Could not write to:\n{_app_data_path()}\n\n{e}")
+
+    def closeEvent(self, event):
+        self._save_flush_timer.stop()
+        _flush_entries_quiet()
+        super().closeEvent(event)
 
     def _set_theme(self, theme: str) -> None:
         self._theme = _apply_app_theme(theme, self._settings, persist=True)
@@ -1087,6 +1515,9 @@ class MainWindow(QMainWindow):
             f"Entries are saved to:\n{_app_data_path()}",
         )
 
+    def _on_time_changed(self, t: QTime):
+        self._default_time_str = t.toString("HH:mm")
+
     def _set_now(self):
         now = datetime.now()
         self.date_edit.setDate(QDate(now.year, now.month, now.day))
@@ -1097,83 +1528,35 @@ class MainWindow(QMainWindow):
         if dlg.exec() == QDialog.Accepted:
             self.date_edit.setDate(dlg.selected_date())
 
-    def _make_combo(self, options: List[str], placeholder: str = "") -> QComboBox:
-        cb = QComboBox(self)
-        cb.setEditable(True)
-        cb.addItems(options)
-        if placeholder:
-            cb.setPlaceholderText(placeholder)
-        cb.setInsertPolicy(QComboBox.NoInsert)
-        return cb
-
     def _combo_current_text(self, cb: QComboBox) -> str:
         return (cb.currentText() or "").strip()
 
     def _parse_dose(self, dose_text: str) -> float:
-        s = (dose_text or "").strip()
-        if not s:
-            return 0.0
-        s = s.replace(",", ".")
-        m = re.search(r"[-+]?\d*\.?\d+", s)
-        if not m:
-            raise ValueError(f"Invalid dose: '{dose_text}'")
-        return float(m.group(0))
+        return _parse_dose_text(dose_text or "")
 
     def _add_med_row(self):
-        row = self.meds_table.rowCount()
-        self.meds_table.insertRow(row)
-
-        name_cb = self._make_combo(self.med_name_options, placeholder="Medication")
-        self.meds_table.setCellWidget(row, 0, name_cb)
-
-        dose_cb = self._make_combo(self.dose_options, placeholder="Dose")
-        self.meds_table.setCellWidget(row, 1, dose_cb)
-
-        unit_cb = self._make_combo(self.unit_options, placeholder="Unit")
-        self.meds_table.setCellWidget(row, 2, unit_cb)
-
-        route_cb = self._make_combo(self.route_options, placeholder="Route")
-        self.meds_table.setCellWidget(row, 3, route_cb)
-
-        time_item = QTableWidgetItem(self.time_edit.time().toString("HH:mm"))
-        time_item.setTextAlignment(Qt.AlignCenter)
-        self.meds_table.setItem(row, 4, time_item)
-
-        self.meds_table.setCurrentCell(row, 1)
+        row = self.meds_model.append_row(self._default_time_str)
+        self.meds_table.setCurrentIndex(self.meds_model.index(row, 1))
 
     def _remove_selected_rows(self):
         selected = self.meds_table.selectionModel().selectedRows()
-        for idx in sorted((s.row() for s in selected), reverse=True):
-            self.meds_table.removeRow(idx)
-        if self.meds_table.rowCount() == 0:
+        self.meds_model.remove_rows([s.row() for s in selected])
+        if self.meds_model.rowCount() == 0:
             self._add_med_row()
 
-    def _collect_medications(self) -> List[MedicationRow]:
+    def _collect_medications(self) -> Tuple[List[MedicationRow], bool]:
+        """Collect non-empty med rows; returns (meds, has_name)."""
         meds: List[MedicationRow] = []
-        for r in range(self.meds_table.rowCount()):
-            name_widget = self.meds_table.cellWidget(r, 0)
-            name = self._combo_current_text(name_widget) if isinstance(name_widget, QComboBox) else (
-                (self.meds_table.item(r, 0).text() if self.meds_table.item(r, 0) else "").strip()
-            )
-
-            dose_widget = self.meds_table.cellWidget(r, 1)
-            dose_raw = self._combo_current_text(dose_widget) if isinstance(dose_widget, QComboBox) else (
-                (self.meds_table.item(r, 1).text() if self.meds_table.item(r, 1) else "").strip()
-            )
-
-            unit_widget = self.meds_table.cellWidget(r, 2)
-            unit = self._combo_current_text(unit_widget) if isinstance(unit_widget, QComboBox) else (
-                (self.meds_table.item(r, 2).text() if self.meds_table.item(r, 2) else "").strip()
-            )
-
-            route_widget = self.meds_table.cellWidget(r, 3)
-            route = self._combo_current_text(route_widget) if isinstance(route_widget, QComboBox) else (
-                (self.meds_table.item(r, 3).text() if self.meds_table.item(r, 3) else "").strip()
-            )
-
-            time_str = (self.meds_table.item(r, 4).text() if self.meds_table.item(r, 4) else "").strip()
-
-            if not any([name, dose_raw, unit, route, time_str]):
+        has_name = False
+        default_time = self._default_time_str
+        for name, dose_raw, unit, route, time_str in self.meds_model.rows():
+            name = name.strip()
+            dose_raw = dose_raw.strip()
+            unit = unit.strip()
+            route = route.strip()
+            time_str = time_str.strip()
+
+            if not (name or dose_raw or unit or route or time_str):
                 continue  # skip completely empty rows
 
             dose = 0.0
@@ -1181,13 +1564,12 @@ class MainWindow(QMainWindow):
                 dose = self._parse_dose(dose_raw)
 
             if not time_str:
-                time_str = self.time_edit.time().toString("HH:mm")
+                time_str = default_time
 
+            if name:
+                has_name = True
             meds.append(MedicationRow(name=name, dose=dose, unit=unit, route=route, time=time_str))
-        return meds
-
-    def _validate_can_save(self, meds: List[MedicationRow]) -> bool:
-        return any(m.name.strip() for m in meds)
+        return meds, has_name
 
     # --- add: multi-select accessor (store as JSON lists) ---
     def _multiselect_values(self, w: Any) -> List[str]:
@@ -1201,35 +1583,33 @@ class MainWindow(QMainWindow):
 
     def _save_entry(self):
         try:
-            meds = self._collect_medications()
+            meds, has_name = self._collect_medications()
         except ValueError as e:
             QMessageBox.warning(self, "Validation error", str(e))
             return
 
-        if not self._validate_can_save(meds):
+        if not has_name:
             QMessageBox.warning(self, "Missing medication name", "Please enter at least one medication name before saving.")
             return
 
-        dt = datetime(
-            self.date_edit.date().year(),
-            self.date_edit.date().month(),
-            self.date_edit.date().day(),
-            self.time_edit.time().hour(),
-            self.time_edit.time().minute(),
-        )
-        ts = dt.strftime("%Y-%m-%d %H:%M")
+        # one Qt crossing per widget, then plain f-strings (no toString/strftime
+        # format parsing)
+        qdate = self.date_edit.date()
+        qtime = self.time_edit.time()
+        date_str = f"{qdate.year():04d}-{qdate.month():02d}-{qdate.day():02d}"
+        time_str = f"{qtime.hour():02d}:{qtime.minute():02d}"
+        ts = f"{date_str} {time_str}"
 
         record: Dict[str, Any] = {
-            "id": uuid.uuid4().hex,
+            "id": _new_id(),
             "created_at": ts,
             "updated_at": ts,
             "timestamp_local": ts,
-            "date": self.date_edit.date().toString("yyyy-MM-dd"),
-            "time": self.time_edit.time().toString("HH:mm"),
+            "date": date_str,
+            "time": time_str,
             "medications": [
                 {"name": m.name, "dose": m.dose, "unit": m.unit, "route": m.route, "time": m.time}
                 for m in meds
-                if any([m.name.strip(), m.dose, m.unit.strip(), m.route.strip(), m.time.strip()])
             ],
             # --- change: store as lists ---
             "mood": self._multiselect_values(self.mood_edit),
@@ -1237,20 +1617,21 @@ class MainWindow(QMainWindow):
             "symptoms": self._multiselect_values(self.symptoms_edit),
             "libido": self._multiselect_values(self.libido_edit),
             # --- end change ---
-            "notes": self.notes_edit.toPlainText().rstrip(),
         }
-
-        path = _app_data_path()
-        try:
-            entries = _read_entries_json(path)
-            entries.append(record)
-            _write_entries_json_atomic(path, entries)
-        except OSError as e:
-            QMessageBox.critical(self, "Save failed", f"Could not write to:\n{path}\n\n{e}")
-            return
-
-        self.statusBar().showMessage(f"Saved entry: {record.get('timestamp_local','')}", 4000)
-        QMessageBox.information(self, "Saved", f"Entry saved to:\n{path}")
+        # toPlainText walks the whole document; skip it when there is nothing
+        # typed, and leave the key out rather than storing "" for every entry
+        if not self.notes_edit.document().isEmpty():
+            notes = self.notes_edit.toPlainText().rstrip()
+            if notes:
+                record["notes"] = notes
+
+        _upsert_entry(record, defer=True)
+        if not self._save_flush_timer.isActive():
+            self._save_flush_timer.start()
+
+        self.statusBar().showMessage(
+            f"Saved entry {ts} — {len(meds)} medication(s) — {_app_data_path()}", 4000
+        )
         self._clear_form(keep_date_time=True)
 
     def _clear_form(self, keep_date_time: bool = False):
@@ -1271,27 +1652,33 @@ class MainWindow(QMainWindow):
 
         self.notes_edit.clear()
 
-        self.meds_table.setRowCount(0)
+        self.meds_model.clear()
         self._add_med_row()
         self.meds_table.clearSelection()
-        self.meds_table.setCurrentCell(-1, -1)
+        self.meds_table.setCurrentIndex(QModelIndex())
 
         self.statusBar().showMessage("Cleared form", 2500)
 
     def _view_entries(self):
-        dlg = ViewEntriesDialog(self)
-        dlg.resize(1000, 600)
-        dlg.exec()
+        # one dialog per window, refreshed only when the entries changed
+        if self._view_dlg is None:
+            self._view_dlg = ViewEntriesDialog(self)
+            self._view_dlg.resize(1000, 600)
+        else:
+            self._view_dlg.maybe_refresh()
+        self._view_dlg.exec()
 
     def _show_help(self):
-        dlg = HelpDialog(self)
-        dlg.exec()
+        if self._help_dlg is None:
+            self._help_dlg = HelpDialog(self)
+        self._help_dlg.exec()
 
 def main():
     QApplication.setOrganizationName(org_name)
     QApplication.setApplicationName(APP_TITLE)
 
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(_flush_entries_quiet)
 
     settings = QSettings(org_name, APP_TITLE)
     theme = str(settings.value(SETTINGS_THEME_KEY, THEME_DARK) or THEME_DARK).lower()